@@ -1966,16 +1966,29 @@ class QuestionOption(models.Model):
 
     def save(self, *args, **kwargs):
         if not self.identifier:
-            charset = list('ABCDEFGHJKLMNPQRSTUVWXYZ3789')
-            while True:
-                code = get_random_string(length=8, allowed_chars=charset)
-                if not QuestionOption.objects.filter(question__event=self.question.event, identifier=code).exists():
-                    self.identifier = code
-                    break
+            self.identifier = QuestionOption.generate_identifiers(self.question.event, 1)[0]
             if 'update_fields' in kwargs:
                 kwargs['update_fields'] = {'identifier'}.union(kwargs['update_fields'])
         super().save(*args, **kwargs)
 
+    @staticmethod
+    def generate_identifiers(event, count):
+        """
+        Returns a list of ``count`` random identifiers that are not yet used by any question option
+        within the given event. All candidates of a round are checked with one database query.
+        """
+        charset = list('ABCDEFGHJKLMNPQRSTUVWXYZ3789')
+        codes = set()
+        while len(codes) < count:
+            candidates = {
+                get_random_string(length=8, allowed_chars=charset) for i in range(count - len(codes))
+            } - codes
+            candidates -= set(QuestionOption.objects.filter(
+                question__event=event, identifier__in=candidates
+            ).values_list('identifier', flat=True))
+            codes |= candidates
+        return list(codes)
+
     @staticmethod
     def clean_identifier(event, code, instance=None, known=[]):
         qs = QuestionOption.objects.filter(question__event=event, identifier=code)
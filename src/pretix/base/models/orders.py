@@ -1384,6 +1384,27 @@ class QuestionAnswer(models.Model):
     def __str__(self):
         return self.to_string(use_cached=True)
 
+    @staticmethod
+    def format_date_answer(question_type, answer, tz=None):
+        """
+        Render the raw value of a date, time or datetime answer as a string.
+
+        :param question_type: One of ``Question.TYPE_DATE``, ``Question.TYPE_TIME`` or ``Question.TYPE_DATETIME``
+        :param answer: The answer as stored in the database
+        :param tz: Timezone datetime answers are converted to, if given
+        """
+        try:
+            d = dateutil.parser.parse(answer)
+        except ValueError:
+            return answer
+        if question_type == Question.TYPE_DATETIME:
+            if tz:
+                d = d.astimezone(tz)
+            return date_format(d, "SHORT_DATETIME_FORMAT")
+        elif question_type == Question.TYPE_DATE:
+            return date_format(d, "SHORT_DATE_FORMAT")
+        return date_format(d, "TIME_FORMAT")
+
     def to_string_i18n(self):
         return self.to_string(use_cached=False)
 
@@ -1403,27 +1424,11 @@ class QuestionAnswer(models.Model):
             return str(_("No"))
         elif self.question.type == Question.TYPE_FILE:
             return str(_("<file>"))
-        elif self.question.type == Question.TYPE_DATETIME and self.answer:
-            try:
-                d = dateutil.parser.parse(self.answer)
-                if self.orderposition:
-                    tz = ZoneInfo(self.orderposition.order.event.settings.timezone)
-                    d = d.astimezone(tz)
-                return date_format(d, "SHORT_DATETIME_FORMAT")
-            except ValueError:
-                return self.answer
-        elif self.question.type == Question.TYPE_DATE and self.answer:
-            try:
-                d = dateutil.parser.parse(self.answer)
-                return date_format(d, "SHORT_DATE_FORMAT")
-            except ValueError:
-                return self.answer
-        elif self.question.type == Question.TYPE_TIME and self.answer:
-            try:
-                d = dateutil.parser.parse(self.answer)
-                return date_format(d, "TIME_FORMAT")
-            except ValueError:
-                return self.answer
+        elif self.question.type in (Question.TYPE_DATETIME, Question.TYPE_DATE, Question.TYPE_TIME) and self.answer:
+            tz = None
+            if self.question.type == Question.TYPE_DATETIME and self.orderposition:
+                tz = ZoneInfo(self.orderposition.order.event.settings.timezone)
+            return self.format_date_answer(self.question.type, self.answer, tz)
         elif self.question.type == Question.TYPE_COUNTRYCODE and self.answer:
             return Country(self.answer).name or self.answer
         elif self.question.type == Question.TYPE_PHONENUMBER and self.answer:
@@ -28,14 +28,14 @@ import django_redis
 from django.conf import settings
 from django.db import models
 from django.db.models import (
-    Case, Count, F, Func, Max, OuterRef, Q, Subquery, Sum, Value, When,
-    prefetch_related_objects,
+    Case, Count, F, Func, Max, OuterRef, Prefetch, Q, Subquery, Sum, Value,
+    When, prefetch_related_objects,
 )
 from django.utils.timezone import now
 
 from pretix.base.models import (
-    CartPosition, Checkin, Order, OrderPosition, Quota, Voucher,
-    WaitingListEntry,
+    CartPosition, Checkin, Item, ItemVariation, Order, OrderPosition, Quota,
+    Voucher, WaitingListEntry,
 )
 
 from ..signals import quota_availability
@@ -53,6 +53,9 @@ class QuotaAvailability:
         qa.compute()
         print(qa.results)
 
+    If all queued quotas have been loaded with the prefetches returned by ``QuotaAvailability.prefetch_products()``,
+    they are used instead of querying which products belong to the quotas again.
+
     Properties you can access after computation.
 
     * results (dict mapping quotas to availability tuples)
@@ -62,6 +65,8 @@ class QuotaAvailability:
     * count_vouchers (dict mapping quotas to ints)
     * count_waitinglist (dict mapping quotas to ints)
     * count_cart (dict mapping quotas to ints)
+    * results_ignoring_closed (dict mapping closed quotas to the availability tuples they would have if they were
+      open, only filled with ``full_results``)
     """
 
     def __init__(self, count_waitinglist=True, ignore_closed=False, full_results=False, early_out=True):
@@ -96,6 +101,7 @@ class QuotaAvailability:
         self._early_out = early_out
         self._quota_objects = {}
         self.results = {}
+        self.results_ignoring_closed = {}
         self.count_paid_orders = defaultdict(int)
         self.count_pending_orders = defaultdict(int)
         self.count_exited_orders = defaultdict(int)
@@ -111,6 +117,32 @@ class QuotaAvailability:
 
         self.sizes = {}
 
+    @staticmethod
+    def prefetch_products(items_queryset=None, variations_queryset=None):
+        """
+        Returns prefetches for the items and variations of quotas that ``compute()`` can use instead of querying them
+        again. They are stored in ``availability_items`` and ``availability_variations`` on each quota.
+
+        :param items_queryset: Queryset to load the items with, e.g. to load further fields. It may restrict the
+                               loaded columns or add annotations, but must not filter out any items.
+        :param variations_queryset: Same for the variations.
+        """
+        return [
+            Prefetch(
+                'items',
+                queryset=items_queryset if items_queryset is not None else Item.objects.only('id'),
+                to_attr='availability_items',
+            ),
+            Prefetch(
+                'variations',
+                queryset=(
+                    variations_queryset if variations_queryset is not None
+                    else ItemVariation.objects.only('id', 'item_id')
+                ),
+                to_attr='availability_variations',
+            ),
+        ]
+
     def queue(self, *quota):
         self._queue += quota
 
@@ -239,16 +271,27 @@ class QuotaAvailability:
             self.count_vouchers[q] = 0
             self.count_waitinglist[q] = 0
 
-        # Fetch which quotas belong to which items and variations
-        q_items = Quota.items.through.objects.filter(
-            quota_id__in=[q.pk for q in quotas]
-        ).values('quota_id', 'item_id')
+        # Fetch which quotas belong to which items and variations, unless the caller already prefetched them
+        if all(hasattr(q, 'availability_items') and hasattr(q, 'availability_variations') for q in quotas):
+            q_items = [
+                {'quota_id': q.pk, 'item_id': i.pk}
+                for q in quotas for i in q.availability_items
+            ]
+            q_vars = [
+                {'quota_id': q.pk, 'itemvariation_id': v.pk, 'itemvariation__item_id': v.item_id}
+                for q in quotas for v in q.availability_variations
+            ]
+        else:
+            q_items = Quota.items.through.objects.filter(
+                quota_id__in=[q.pk for q in quotas]
+            ).values('quota_id', 'item_id')
+            q_vars = Quota.variations.through.objects.filter(
+                quota_id__in=[q.pk for q in quotas]
+            ).values('quota_id', 'itemvariation_id', 'itemvariation__item_id')
+
         for m in q_items:
             self._item_to_quotas[m['item_id']].add(self._quota_objects[m['quota_id']])
 
-        q_vars = Quota.variations.through.objects.filter(
-            quota_id__in=[q.pk for q in quotas]
-        ).values('quota_id', 'itemvariation_id', 'itemvariation__item_id')
         for m in q_vars:
             self._var_to_quotas[m['itemvariation_id']].add(self._quota_objects[m['quota_id']])
             # We can't be 100% certain that a quota, when it is connected to a variation, is also always connected to
@@ -286,6 +329,13 @@ class QuotaAvailability:
                 else:
                     raise ValueError("inconclusive quota")
 
+        if self._full_results:
+            # Closed quotas have been computed like open ones, keep that result around for statistics
+            for q in quotas:
+                if q.closed and not self._ignore_closed:
+                    self.results_ignoring_closed[q] = self.results[q]
+                    self.results[q] = Quota.AVAILABILITY_ORDERED, 0
+
     def _compute_orders(self, quotas, q_items, q_vars, size_left):
         events = {q.event_id for q in quotas}
         subevents = {q.subevent_id for q in quotas}
@@ -484,7 +534,7 @@ class QuotaAvailability:
 
     def _compute_early_outs(self, quotas):
         for q in quotas:
-            if q.closed and not self._ignore_closed:
+            if q.closed and not self._ignore_closed and not self._full_results:
                 self.results[q] = Quota.AVAILABILITY_ORDERED, 0
             elif q.size is None:
                 self.results[q] = Quota.AVAILABILITY_OK, None
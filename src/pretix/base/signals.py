@@ -33,7 +33,7 @@
 # License for the specific language governing permissions and limitations under the License.
 
 import warnings
-from typing import Any, Callable, List, Tuple
+from typing import Any, Callable, Iterator, List, Tuple
 
 import django.dispatch
 from django.apps import apps
@@ -107,23 +107,33 @@ class EventPluginSignal(django.dispatch.Signal):
         Send signal from sender to all connected receivers that belong to
         plugins enabled for the given Event.
 
+        sender is required to be an instance of ``pretix.base.models.Event``.
+        """
+        return list(self.send_lazy(sender, **named))
+
+    def send_lazy(self, sender: Event, **named) -> Iterator[Tuple[Callable, Any]]:
+        """
+        Works like ``send``, but returns a generator that only calls the next receiver when the next
+        response is requested. If the caller stops iterating early, the remaining receivers are not
+        called at all.
+
         sender is required to be an instance of ``pretix.base.models.Event``.
         """
         if sender and not isinstance(sender, Event):
             raise ValueError("Sender needs to be an event.")
 
-        responses = []
+        return self._send_lazy(sender, **named)
+
+    def _send_lazy(self, sender: Event, **named) -> Iterator[Tuple[Callable, Any]]:
         if not self.receivers or self.sender_receivers_cache.get(sender) is NO_RECEIVERS:
-            return responses
+            return
 
         if not app_cache:
             _populate_app_cache()
 
         for receiver in self._sorted_receivers(sender):
             if is_receiver_active(sender, receiver):
-                response = receiver(signal=self, sender=sender, **named)
-                responses.append((receiver, response))
-        return responses
+                yield receiver, receiver(signal=self, sender=sender, **named)
 
     def send_chained(self, sender: Event, chain_kwarg_name, **named) -> List[Tuple[Callable, Any]]:
         """
@@ -43,6 +43,7 @@ from django.core.exceptions import ValidationError
 from django.db.models import Max, Q
 from django.forms import ChoiceField, RadioSelect
 from django.forms.formsets import DELETION_FIELD_NAME
+from django.forms.models import inlineformset_factory
 from django.urls import reverse
 from django.utils.functional import cached_property
 from django.utils.html import escape, format_html
@@ -273,6 +274,13 @@ class QuestionOptionForm(I18nModelForm):
         ]
 
 
+QuestionOptionInlineFormSet = inlineformset_factory(
+    Question, QuestionOption,
+    form=QuestionOptionForm, formset=I18nFormSet,
+    can_order=True, can_delete=True, extra=0
+)
+
+
 class QuotaForm(I18nModelForm):
     itemvars = forms.MultipleChoiceField(
         label=_("Products"),
@@ -935,9 +943,10 @@ class ItemVariationsFormSet(I18nFormSet):
     def _construct_form(self, i, **kwargs):
         kwargs['event'] = self.event
         kwargs['membership_types'] = self.mt
+        kwargs['sales_channels'] = self.sales_channels
         return super()._construct_form(i, **kwargs)
 
-    @property
+    @cached_property
     def empty_form(self):
         self.is_valid()
         form = self.form(
@@ -946,6 +955,7 @@ class ItemVariationsFormSet(I18nFormSet):
             empty_permitted=True,
             use_required_attribute=False,
             membership_types=self.mt,
+            sales_channels=self.sales_channels,
             locales=self.locales,
             event=self.event
         )
@@ -955,17 +965,22 @@ class ItemVariationsFormSet(I18nFormSet):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.mt = self.event.organizer.membership_types.all()
+        # Shared by all variation forms, so the choices are not queried again for every form
+        self.sales_channels = list(self.event.organizer.sales_channels.all())
 
 
 class ItemVariationForm(I18nModelForm):
     def __init__(self, *args, **kwargs):
         qs = kwargs.pop('membership_types')
+        sales_channels = kwargs.pop('sales_channels')
         super().__init__(*args, **kwargs)
         change_decimal_field(self.fields['default_price'], self.event.currency)
-        self.fields['limit_sales_channels'].queryset = self.event.organizer.sales_channels.all()
-        self.fields['limit_sales_channels'].widget = SalesChannelCheckboxSelectMultiple(self.event, attrs={
+        sc_field = self.fields['limit_sales_channels']
+        sc_field.queryset = self.event.organizer.sales_channels.all()
+        sc_iterator = sc_field.iterator(sc_field)
+        sc_field.widget = SalesChannelCheckboxSelectMultiple(self.event, attrs={
             'data-inverse-dependency': '<[name$=all_sales_channels]',
-        }, choices=self.fields['limit_sales_channels'].widget.choices)
+        }, choices=[sc_iterator.choice(c) for c in sales_channels])
 
         self.fields['description'].widget.attrs['rows'] = 3
         if qs:
@@ -1081,6 +1096,13 @@ class ItemVariationForm(I18nModelForm):
         return self.event._cached_item_meta_properties
 
 
+ItemVariationInlineFormSet = inlineformset_factory(
+    Item, ItemVariation,
+    form=ItemVariationForm, formset=ItemVariationsFormSet,
+    can_order=True, can_delete=True, extra=0
+)
+
+
 class ItemAddOnsFormSet(I18nFormSet):
     title = _('Add-ons')
     template = "pretixcontrol/item/include_addons.html"
@@ -1156,6 +1178,13 @@ class ItemAddOnForm(I18nModelForm):
         }
 
 
+ItemAddOnInlineFormSet = inlineformset_factory(
+    Item, ItemAddOn,
+    form=ItemAddOnForm, formset=ItemAddOnsFormSet,
+    can_order=True, can_delete=True, extra=0
+)
+
+
 class ItemBundleFormSet(I18nFormSet):
     template = "pretixcontrol/item/include_bundles.html"
     title = _('Bundled products')
@@ -1288,6 +1317,14 @@ class ItemBundleForm(I18nModelForm):
         ]
 
 
+ItemBundleInlineFormSet = inlineformset_factory(
+    Item, ItemBundle,
+    form=ItemBundleForm, formset=ItemBundleFormSet,
+    fk_name='base_item',
+    can_order=False, can_delete=True, extra=0
+)
+
+
 class ItemMetaValueForm(forms.ModelForm):
 
     def __init__(self, *args, **kwargs):
@@ -34,23 +34,24 @@
 # License for the specific language governing permissions and limitations under the License.
 
 import json
-from collections import OrderedDict, namedtuple
-from itertools import groupby
+from collections import OrderedDict, defaultdict, namedtuple
+from itertools import chain
 from json.decoder import JSONDecodeError
+from zoneinfo import ZoneInfo
 
 from django.contrib import messages
 from django.core.exceptions import PermissionDenied
 from django.core.files import File
-from django.db import transaction
+from django.db import connections, transaction
 from django.db.models import (
-    Count, Exists, F, OuterRef, Prefetch, ProtectedError, Q,
+    BooleanField, Count, Exists, F, OuterRef, Prefetch, ProtectedError, Q,
+    Value, prefetch_related_objects,
 )
-from django.forms.models import inlineformset_factory
 from django.http import (
     Http404, HttpResponse, HttpResponseBadRequest, HttpResponseRedirect,
 )
 from django.shortcuts import redirect
-from django.urls import resolve, reverse
+from django.urls import reverse
 from django.utils.functional import cached_property
 from django.utils.timezone import now
 from django.utils.translation import gettext, gettext_lazy as _
@@ -62,27 +63,29 @@ from django_countries.fields import Country
 from pretix.api.serializers.item import (
     ItemAddOnSerializer, ItemBundleSerializer, ItemVariationSerializer,
 )
-from pretix.base.forms import I18nFormSet
 from pretix.base.models import (
-    CartPosition, Item, ItemCategory, ItemVariation, Order, OrderPosition,
-    Question, QuestionAnswer, QuestionOption, Quota, SeatCategoryMapping,
+    CartPosition, Item, ItemCategory, ItemVariation, ItemVariationMetaValue,
+    LogEntry, MembershipType, Order, OrderPosition, Question, QuestionAnswer,
+    QuestionOption, Quota, SalesChannel, SeatCategoryMapping, Transaction,
     Voucher,
 )
 from pretix.base.models.event import SubEvent
-from pretix.base.models.items import ItemAddOn, ItemBundle, ItemMetaValue
+from pretix.base.models.items import ItemMetaValue
 from pretix.base.services.quotas import QuotaAvailability
 from pretix.base.services.tickets import invalidate_cache
+from pretix.base.shredder import slow_delete
 from pretix.base.signals import quota_availability
 from pretix.control.forms.item import (
-    CategoryForm, ItemAddOnForm, ItemAddOnsFormSet, ItemBundleForm,
-    ItemBundleFormSet, ItemCreateForm, ItemMetaValueForm, ItemUpdateForm,
-    ItemVariationForm, ItemVariationsFormSet, QuestionForm, QuestionOptionForm,
+    CategoryForm, ItemAddOnInlineFormSet, ItemBundleInlineFormSet,
+    ItemCreateForm, ItemMetaValueForm, ItemUpdateForm,
+    ItemVariationInlineFormSet, QuestionForm, QuestionOptionInlineFormSet,
     QuotaForm,
 )
 from pretix.control.permissions import (
     EventPermissionRequiredMixin, event_permission_required,
 )
 from pretix.control.signals import item_forms, item_formsets
+from pretix.helpers import OF_SELF
 from pretix.helpers.models import modelcopy
 
 from ...helpers.compat import CompatDeleteView
@@ -90,7 +93,16 @@ from . import ChartContainingView, CreateView, PaginationMixin, UpdateView
 
 
 def has_truthy_attr(cls, attr):
-    return hasattr(cls, attr) and getattr(cls, attr)
+    return bool(getattr(cls, attr, None))
+
+
+def changed_data_for_log(form):
+    data = {}
+    cleaned_data = form.cleaned_data
+    for k in form.changed_data:
+        v = cleaned_data.get(k)
+        data[k] = v.name if isinstance(v, File) else v
+    return data
 
 
 class ItemList(ListView):
@@ -102,34 +114,54 @@ class ItemList(ListView):
     template_name = 'pretixcontrol/items/index.html'
 
     def get_queryset(self):
-        requires_seat = Exists(
-            SeatCategoryMapping.objects.filter(
-                product_id=OuterRef('pk'),
+        if self.request.event.seat_category_mappings.exists():
+            requires_seat = Exists(
+                SeatCategoryMapping.objects.filter(
+                    product_id=OuterRef('pk'),
+                )
             )
-        )
+        else:
+            # Most events do not use seating, no need for a subquery per product
+            requires_seat = Value(False, output_field=BooleanField())
         return Item.objects.filter(
             event=self.request.event
-        ).select_related("tax_rule").annotate(
+        ).select_related("tax_rule").only(
+            # Only load what the product list actually displays, products can have large text fields
+            'id', 'event_id', 'category_id', 'position', 'name', 'internal_name', 'active', 'all_sales_channels',
+            'available_from', 'available_until', 'admission', 'personalized', 'issue_giftcard', 'require_bundling',
+            'hide_without_voucher', 'require_voucher', 'free_price', 'default_price', 'original_price',
+            'tax_rule__id', 'tax_rule__name', 'tax_rule__rate', 'tax_rule__price_includes_tax',
+        ).annotate(
             var_count=Count('variations'),
             requires_seat=requires_seat,
-        ).prefetch_related("category", "limit_sales_channels").order_by(
-            F('category__position').asc(nulls_first=True),
-            'category', 'position'
+        ).prefetch_related("limit_sales_channels").order_by(
+            # Products are grouped by category in get_context_data, no need to join the categories for sorting
+            'position', 'id'
         )
 
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
         ctx['sales_channels'] = self.request.organizer.sales_channels.all()
-        items_by_category = {cat: list(items) for cat, items in groupby(ctx['items'], lambda item: item.category)}
-        ctx['cat_list'] = [(cat, items_by_category.get(cat, [])) for cat in [None, *self.request.event.categories.all()]]
+        categories = list(self.request.event.categories.only(
+            # The list only shows the category headers, the descriptions are not needed
+            'id', 'event_id', 'name', 'internal_name', 'position', 'is_addon', 'cross_selling_mode',
+        ))
+        categories_by_id = {c.pk: c for c in categories}
+        items_by_category = defaultdict(list)
+        for item in ctx['items']:
+            # Re-use the category objects loaded above instead of fetching them again per item
+            item.category = categories_by_id.get(item.category_id)
+            items_by_category[item.category_id].append(item)
+        ctx['cat_list'] = [(cat, items_by_category.get(cat.pk if cat else None, [])) for cat in [None, *categories]]
         return ctx
 
 
 def item_move(request, item, up=True):
     """
     This is a helper function to avoid duplicating code in item_move_up and
-    item_move_down. It takes an item and a direction and then tries to bring
-    all items for this category in a new order.
+    item_move_down. It takes an item and a direction and then swaps its position
+    with the neighboring item of the same category. Only if positions in the
+    category are not unique, all items of the category are renumbered instead.
     """
     try:
         item = request.event.items.get(
@@ -137,23 +169,43 @@ def item_move(request, item, up=True):
         )
     except Item.DoesNotExist:
         raise Http404(_("The requested product does not exist."))
-    items = list(request.event.items.filter(category=item.category).order_by("position"))
-
-    index = items.index(item)
-    if index != 0 and up:
-        items[index - 1], items[index] = items[index], items[index - 1]
-    elif index != len(items) - 1 and not up:
-        items[index + 1], items[index] = items[index], items[index + 1]
-
-    for i, item in enumerate(items):
-        if item.position != i:
-            item.position = i
-            item.save()
-            item.log_action(
+    siblings = request.event.items.filter(category_id=item.category_id).exclude(pk=item.pk)
+    # Fetch the two closest siblings in the direction of the move. If the item, the direct neighbor and the
+    # sibling after that all have different positions, swapping with the neighbor is enough.
+    if up:
+        neighbors = list(siblings.filter(position__lte=item.position).order_by('-position')[:2])
+    else:
+        neighbors = list(siblings.filter(position__gte=item.position).order_by('position')[:2])
+
+    changed = []
+    if neighbors and len({item.position, *(n.position for n in neighbors)}) == len(neighbors) + 1:
+        neighbor = neighbors[0]
+        item.position, neighbor.position = neighbor.position, item.position
+        changed = [item, neighbor]
+    elif neighbors:
+        # Positions are not unique, so we need to bring all items of the category in a consistent order
+        items = list(request.event.items.filter(category_id=item.category_id).order_by("position"))
+        index = items.index(item)
+        if index != 0 and up:
+            items[index - 1], items[index] = items[index], items[index - 1]
+        elif index != len(items) - 1 and not up:
+            items[index + 1], items[index] = items[index], items[index + 1]
+        for i, it in enumerate(items):
+            if it.position != i:
+                it.position = i
+                changed.append(it)
+
+    if changed:
+        Item.objects.bulk_update(changed, ['position'])
+        LogEntry.bulk_create_and_postprocess([
+            it.log_action(
                 'pretix.event.item.reordered', user=request.user, data={
-                    'position': i,
-                }
+                    'position': it.position,
+                }, save=False
             )
+            for it in changed
+        ])
+        request.event.cache.clear()
     messages.success(request, _('The order of items has been updated.'))
 
 
@@ -184,7 +236,8 @@ def reorder_items(request, organizer, event, category):
     except (JSONDecodeError, KeyError, ValueError):
         return HttpResponseBadRequest("expected JSON: {ids:[]}")
 
-    input_items = list(request.event.items.filter(id__in=[i for i in ids if i.isdigit()]))
+    item_ids = [i for i in ids if i.isdigit()]
+    input_items = request.event.items.in_bulk(item_ids)
 
     if len(input_items) != len(ids):
         raise Http404(_("Some of the provided object ids are invalid."))
@@ -194,18 +247,25 @@ def reorder_items(request, organizer, event, category):
     else:
         target_category = None
 
-    for i in input_items:
-        pos = ids.index(str(i.pk))
-        if pos != i.position or target_category != i.category:  # Save unneccessary UPDATE queries
+    changed = []
+    log_entries = []
+    for pos, sid in enumerate(ids):
+        i = input_items[int(sid)]
+        if pos != i.position or (target_category and target_category.pk) != i.category_id:  # Save unneccessary UPDATE queries
             i.position = pos
             i.category = target_category
-            i.save(update_fields=['position', 'category_id'])
-            i.log_action(
+            changed.append(i)
+            log_entries.append(i.log_action(
                 'pretix.event.item.reordered', user=request.user, data={
-                    'position': i,
+                    'position': pos,
                     'category': target_category and target_category.pk,
-                }
-            )
+                }, save=False
+            ))
+
+    if changed:
+        Item.objects.bulk_update(changed, ['position', 'category'], batch_size=500)
+        LogEntry.bulk_create_and_postprocess(log_entries)
+        request.event.cache.clear()
 
     return HttpResponse()
 
@@ -227,9 +287,7 @@ class CategoryDelete(EventPermissionRequiredMixin, CompatDeleteView):
     @transaction.atomic
     def delete(self, request, *args, **kwargs):
         self.object = self.get_object()
-        for item in self.object.items.all():
-            item.category = None
-            item.save()
+        self.object.items.update(category=None)
         success_url = self.get_success_url()
         self.object.log_action('pretix.event.category.deleted', user=self.request.user)
         self.object.delete()
@@ -251,10 +309,9 @@ class CategoryUpdate(EventPermissionRequiredMixin, UpdateView):
     context_object_name = 'category'
 
     def get_object(self, queryset=None) -> ItemCategory:
-        url = resolve(self.request.path_info)
         try:
             return self.request.event.categories.get(
-                id=url.kwargs['category']
+                id=self.kwargs['category']
             )
         except ItemCategory.DoesNotExist:
             raise Http404(_("The requested product category does not exist."))
@@ -340,8 +397,9 @@ class CategoryList(PaginationMixin, ListView):
 def category_move(request, category, up=True):
     """
     This is a helper function to avoid duplicating code in category_move_up and
-    category_move_down. It takes a category and a direction and then tries to bring
-    all categories for this event in a new order.
+    category_move_down. It takes a category and a direction and then swaps its
+    position with the neighboring category. Only if positions in the event are
+    not unique, all categories of the event are renumbered instead.
     """
     try:
         category = request.event.categories.get(
@@ -349,23 +407,43 @@ def category_move(request, category, up=True):
         )
     except ItemCategory.DoesNotExist:
         raise Http404(_("The requested product category does not exist."))
-    categories = list(request.event.categories.order_by("position"))
-
-    index = categories.index(category)
-    if index != 0 and up:
-        categories[index - 1], categories[index] = categories[index], categories[index - 1]
-    elif index != len(categories) - 1 and not up:
-        categories[index + 1], categories[index] = categories[index], categories[index + 1]
-
-    for i, cat in enumerate(categories):
-        if cat.position != i:
-            cat.position = i
-            cat.save()
+    siblings = request.event.categories.exclude(pk=category.pk)
+    # Fetch the two closest siblings in the direction of the move. If the category, the direct neighbor and the
+    # sibling after that all have different positions, swapping with the neighbor is enough.
+    if up:
+        neighbors = list(siblings.filter(position__lte=category.position).order_by('-position')[:2])
+    else:
+        neighbors = list(siblings.filter(position__gte=category.position).order_by('position')[:2])
+
+    changed = []
+    if neighbors and len({category.position, *(n.position for n in neighbors)}) == len(neighbors) + 1:
+        neighbor = neighbors[0]
+        category.position, neighbor.position = neighbor.position, category.position
+        changed = [category, neighbor]
+    elif neighbors:
+        # Positions are not unique, so we need to bring all categories in a consistent order
+        categories = list(request.event.categories.order_by("position"))
+        index = categories.index(category)
+        if index != 0 and up:
+            categories[index - 1], categories[index] = categories[index], categories[index - 1]
+        elif index != len(categories) - 1 and not up:
+            categories[index + 1], categories[index] = categories[index], categories[index + 1]
+        for i, cat in enumerate(categories):
+            if cat.position != i:
+                cat.position = i
+                changed.append(cat)
+
+    if changed:
+        ItemCategory.objects.bulk_update(changed, ['position'])
+        LogEntry.bulk_create_and_postprocess([
             cat.log_action(
                 'pretix.event.category.reordered', user=request.user, data={
-                    'position': i,
-                }
+                    'position': cat.position,
+                }, save=False
             )
+            for cat in changed
+        ])
+        request.event.cache.clear()
     messages.success(request, _('The order of categories has been updated.'))
 
 
@@ -396,24 +474,33 @@ def reorder_categories(request, organizer, event):
     except (JSONDecodeError, KeyError, ValueError):
         return HttpResponseBadRequest("expected JSON: {ids:[]}")
 
-    input_categories = list(request.event.categories.filter(id__in=[i for i in ids if i.isdigit()]))
+    # All categories need to be part of the request anyway, so a single query tells us both whether the
+    # ids are valid and whether they are complete
+    input_categories = request.event.categories.in_bulk()
 
-    if len(input_categories) != len(ids):
+    if len(set(ids)) != len(ids) or not all(i.isdigit() and int(i) in input_categories for i in ids):
         raise Http404(_("Some of the provided object ids are invalid."))
 
-    if len(input_categories) != request.event.categories.count():
+    if len(input_categories) != len(ids):
         raise Http404(_("Not all objects have been selected."))
 
-    for c in input_categories:
-        pos = ids.index(str(c.pk))
+    changed = []
+    log_entries = []
+    for pos, sid in enumerate(ids):
+        c = input_categories[int(sid)]
         if pos != c.position:  # Save unneccessary UPDATE queries
             c.position = pos
-            c.save(update_fields=['position'])
-            c.log_action(
+            changed.append(c)
+            log_entries.append(c.log_action(
                 'pretix.event.category.reordered', user=request.user, data={
                     'position': pos,
-                }
-            )
+                }, save=False
+            ))
+
+    if changed:
+        ItemCategory.objects.bulk_update(changed, ['position'], batch_size=500)
+        LogEntry.bulk_create_and_postprocess(log_entries)
+        request.event.cache.clear()
 
     return HttpResponse()
 
@@ -422,6 +509,18 @@ FakeQuestion = namedtuple(
     'FakeQuestion', 'id question position required'
 )
 
+# id, label, setting enabling the question, setting making it required
+SYSTEM_QUESTIONS = (
+    ('attendee_name_parts', _('Attendee name'), 'attendee_names_asked', 'attendee_names_required'),
+    ('attendee_email', _('Attendee email'), 'attendee_emails_asked', 'attendee_emails_required'),
+    ('company', _('Company'), 'attendee_company_asked', 'attendee_company_required'),
+    ('street', _('Street'), 'attendee_addresses_asked', 'attendee_addresses_required'),
+    ('zipcode', _('ZIP code'), 'attendee_addresses_asked', 'attendee_addresses_required'),
+    ('city', _('City'), 'attendee_addresses_asked', 'attendee_addresses_required'),
+    ('country', _('Country'), 'attendee_addresses_asked', 'attendee_addresses_required'),
+)
+SYSTEM_QUESTION_IDS = tuple(q[0] for q in SYSTEM_QUESTIONS)
+
 
 class QuestionList(ListView):
     model = Question
@@ -435,83 +534,18 @@ class QuestionList(ListView):
         ctx = super().get_context_data(**kwargs)
         questions = []
 
-        if self.request.event.settings.attendee_names_asked:
-            questions.append(
-                FakeQuestion(
-                    id='attendee_name_parts',
-                    question=_('Attendee name'),
-                    position=self.request.event.settings.system_question_order.get(
-                        'attendee_name_parts', 0
-                    ),
-                    required=self.request.event.settings.attendee_names_required,
-                )
-            )
-
-        if self.request.event.settings.attendee_emails_asked:
-            questions.append(
-                FakeQuestion(
-                    id='attendee_email',
-                    question=_('Attendee email'),
-                    position=self.request.event.settings.system_question_order.get(
-                        'attendee_email', 0
-                    ),
-                    required=self.request.event.settings.attendee_emails_required,
-                )
-            )
-
-        if self.request.event.settings.attendee_company_asked:
-            questions.append(
-                FakeQuestion(
-                    id='company',
-                    question=_('Company'),
-                    position=self.request.event.settings.system_question_order.get(
-                        'company', 0
-                    ),
-                    required=self.request.event.settings.attendee_company_required,
-                )
-            )
-
-        if self.request.event.settings.attendee_addresses_asked:
-            questions.append(
-                FakeQuestion(
-                    id='street',
-                    question=_('Street'),
-                    position=self.request.event.settings.system_question_order.get(
-                        'street', 0
-                    ),
-                    required=self.request.event.settings.attendee_addresses_required,
-                )
-            )
-            questions.append(
-                FakeQuestion(
-                    id='zipcode',
-                    question=_('ZIP code'),
-                    position=self.request.event.settings.system_question_order.get(
-                        'zipcode', 0
-                    ),
-                    required=self.request.event.settings.attendee_addresses_required,
-                )
-            )
-            questions.append(
-                FakeQuestion(
-                    id='city',
-                    question=_('City'),
-                    position=self.request.event.settings.system_question_order.get(
-                        'city', 0
-                    ),
-                    required=self.request.event.settings.attendee_addresses_required,
-                )
-            )
-            questions.append(
-                FakeQuestion(
-                    id='country',
-                    question=_('Country'),
-                    position=self.request.event.settings.system_question_order.get(
-                        'country', 0
-                    ),
-                    required=self.request.event.settings.attendee_addresses_required,
+        settings = self.request.event.settings
+        system_question_order = settings.system_question_order
+        for qid, label, asked_setting, required_setting in SYSTEM_QUESTIONS:
+            if getattr(settings, asked_setting):
+                questions.append(
+                    FakeQuestion(
+                        id=qid,
+                        question=label,
+                        position=system_question_order.get(qid, 0),
+                        required=getattr(settings, required_setting),
+                    )
                 )
-            )
 
         questions += list(ctx['questions'])
         questions.sort(key=lambda q: q.position)
@@ -528,64 +562,75 @@ def reorder_questions(request, organizer, event):
     except (JSONDecodeError, KeyError, ValueError):
         return HttpResponseBadRequest("expected JSON: {ids:[]}")
 
+    id_to_pos = {sid: pos for pos, sid in enumerate(ids)}
     # filter system_questions - normal questions are int/digit, system_questions strings
     custom_question_ids = [i for i in ids if i.isdigit()]
-    input_questions = list(request.event.questions.filter(id__in=custom_question_ids))
+    input_questions = request.event.questions.in_bulk()
 
-    if len(input_questions) != len(custom_question_ids):
+    if len(set(custom_question_ids)) != len(custom_question_ids) or not all(int(i) in input_questions for i in custom_question_ids):
         raise Http404(_("Some of the provided object ids are invalid."))
 
-    if len(input_questions) != request.event.questions.count():
+    if len(input_questions) != len(custom_question_ids):
         raise Http404(_("Not all objects have been selected."))
 
-    for q in input_questions:
-        pos = ids.index(str(q.pk))
+    changed = []
+    log_entries = []
+    for pos, sid in enumerate(ids):
+        if not sid.isdigit():
+            continue
+        q = input_questions[int(sid)]
         if pos != q.position:  # Save unneccessary UPDATE queries
             q.position = pos
-            q.save(update_fields=['position'])
-            q.log_action(
+            changed.append(q)
+            log_entries.append(q.log_action(
                 'pretix.event.question.reordered', user=request.user, data={
                     'position': pos,
-                }
-            )
-
-    system_question_order = {}
-    for s in ('attendee_name_parts', 'attendee_email', 'company', 'street', 'zipcode', 'city', 'country'):
-        if s in ids:
-            system_question_order[s] = ids.index(s)
-        else:
-            system_question_order[s] = -1
-    request.event.settings.system_question_order = system_question_order
-    request.event.log_action(
-        'pretix.event.settings', user=request.user, data={
-            'system_question_order': system_question_order,
-        }
-    )
+                }, save=False
+            ))
+
+    if changed:
+        Question.objects.bulk_update(changed, ['position'], batch_size=500)
+        LogEntry.bulk_create_and_postprocess(log_entries)
+        request.event.cache.clear()
+
+    system_question_order = {s: id_to_pos.get(s, -1) for s in SYSTEM_QUESTION_IDS}
+    if system_question_order != request.event.settings.system_question_order:
+        request.event.settings.system_question_order = system_question_order
+        request.event.log_action(
+            'pretix.event.settings', user=request.user, data={
+                'system_question_order': system_question_order,
+            }
+        )
 
     return HttpResponse()
 
 
-class QuestionDelete(EventPermissionRequiredMixin, CompatDeleteView):
+class QuestionDetailMixin(SingleObjectMixin):
     model = Question
-    template_name = 'pretixcontrol/items/question_delete.html'
-    permission = 'can_change_items'
     context_object_name = 'question'
 
     def get_object(self, queryset=None) -> Question:
         try:
-            return self.request.event.questions.get(
-                id=self.kwargs['question']
-            )
+            if not getattr(self, 'object', None):
+                self.object = self.request.event.questions.get(
+                    id=self.kwargs['question']
+                )
+            return self.object
         except Question.DoesNotExist:
             raise Http404(_("The requested question does not exist."))
 
+
+class QuestionDelete(EventPermissionRequiredMixin, QuestionDetailMixin, CompatDeleteView):
+    template_name = 'pretixcontrol/items/question_delete.html'
+    permission = 'can_change_items'
+
     def get_context_data(self, *args, **kwargs) -> dict:
         context = super().get_context_data(*args, **kwargs)
-        context['dependent'] = list(self.get_object().items.all())
+        context['dependent'] = list(self.object.items.all())
         context['edit_url'] = reverse('control:event.items.questions.edit', kwargs={
             'organizer': self.request.event.organizer.slug,
             'event': self.request.event.slug,
-            'question': self.get_object().pk,
+            'question': self.object.pk,
         })
         return context
 
@@ -608,47 +653,63 @@ class QuestionDelete(EventPermissionRequiredMixin, CompatDeleteView):
 class QuestionMixin:
     @cached_property
     def formset(self):
-        formsetclass = inlineformset_factory(
-            Question, QuestionOption,
-            form=QuestionOptionForm, formset=I18nFormSet,
-            can_order=True, can_delete=True, extra=0
-        )
-        return formsetclass(self.request.POST if self.request.method == "POST" else None,
-                            queryset=(QuestionOption.objects.filter(question=self.object)
-                                      if self.object else QuestionOption.objects.none()),
-                            event=self.request.event)
+        return QuestionOptionInlineFormSet(self.request.POST if self.request.method == "POST" else None,
+                                           queryset=(QuestionOption.objects.filter(question=self.object)
+                                                     if self.object else QuestionOption.objects.none()),
+                                           event=self.request.event)
 
     def save_formset(self, obj):
         if self.formset.is_valid():
+            log_entries = []
+            deleted_pks = []
             for form in self.formset.initial_forms:
                 if form in self.formset.deleted_forms:
                     if not form.instance.pk:
                         continue
-                    obj.log_action(
+                    log_entries.append(obj.log_action(
                         'pretix.event.question.option.deleted', user=self.request.user, data={
                             'id': form.instance.pk
-                        }
-                    )
-                    form.instance.delete()
+                        }, save=False
+                    ))
+                    deleted_pks.append(form.instance.pk)
                     form.instance.pk = None
+            if deleted_pks:
+                QuestionOption.objects.filter(pk__in=deleted_pks).delete()
 
             forms = self.formset.ordered_forms + [
                 ef for ef in self.formset.extra_forms
                 if ef not in self.formset.ordered_forms and ef not in self.formset.deleted_forms
             ]
+            created_forms = []
+            updated_forms = []
             for i, form in enumerate(forms):
                 form.instance.position = i
                 form.instance.question = obj
-                created = not form.instance.pk
-                form.save()
+                if form.instance.pk:
+                    updated_forms.append(form)
+                else:
+                    created_forms.append(form)
+
+            if updated_forms:
+                QuestionOption.objects.bulk_update([f.instance for f in updated_forms], ['answer', 'position'])
+            if created_forms:
+                missing_identifiers = [f.instance for f in created_forms if not f.instance.identifier]
+                for o, identifier in zip(missing_identifiers, QuestionOption.generate_identifiers(
+                        self.request.event, len(missing_identifiers))):
+                    o.identifier = identifier
+                QuestionOption.objects.bulk_create([f.instance for f in created_forms])
+
+            created_set = set(created_forms)
+            for form in forms:
                 if form.has_changed():
                     change_data = {k: form.cleaned_data.get(k) for k in form.changed_data}
                     change_data['id'] = form.instance.pk
-                    obj.log_action(
-                        'pretix.event.question.option.added' if created else
+                    log_entries.append(obj.log_action(
+                        'pretix.event.question.option.added' if form in created_set else
                         'pretix.event.question.option.changed',
-                        user=self.request.user, data=change_data
-                    )
+                        user=self.request.user, data=change_data, save=False
+                    ))
+            LogEntry.bulk_create_and_postprocess(log_entries)
 
             return True
         return False
@@ -665,6 +726,10 @@ class QuestionView(EventPermissionRequiredMixin, QuestionMixin, ChartContainingV
     permission = 'can_change_items'
     template_name_field = 'question'
 
+    @cached_property
+    def items(self):
+        return list(self.object.items.all())
+
     def get_answer_statistics(self):
         opqs = OrderPosition.objects.filter(
             order__event=self.request.event,
@@ -700,7 +765,7 @@ class QuestionView(EventPermissionRequiredMixin, QuestionMixin, ChartContainingV
             opqs = opqs.filter(item_id__in=(i,))
 
         qs = qs.filter(orderposition__in=opqs)
-        op_cnt = opqs.filter(item__in=self.object.items.all()).count()
+        op_cnt = opqs.filter(item__in=self.items).count()
 
         if self.object.type == Question.TYPE_FILE:
             qs = [
@@ -717,14 +782,16 @@ class QuestionView(EventPermissionRequiredMixin, QuestionMixin, ChartContainingV
                 a['answer'] = str(a['options__answer'])
                 del a['options__answer']
         elif self.object.type in (Question.TYPE_TIME, Question.TYPE_DATE, Question.TYPE_DATETIME):
-            qs = qs.order_by('answer')
-            model_cache = {a.answer: a for a in qs}
-            qs = qs.values('answer').annotate(count=Count('id')).order_by('answer')
+            qs = qs.order_by('answer').values('answer').annotate(count=Count('id')).order_by('answer')
+            tz = ZoneInfo(self.request.event.settings.timezone)
             for a in qs:
                 a['alink'] = a['answer']
-                a['answer'] = str(model_cache[a['answer']])
+                if a['answer']:
+                    a['answer'] = QuestionAnswer.format_date_answer(self.object.type, a['answer'], tz)
         else:
-            qs = qs.order_by('answer').values('answer').annotate(count=Count('id')).order_by('-count')
+            qs = qs.order_by('answer').values('answer').annotate(
+                count=Count('id')
+            ).order_by('-count')
 
             if self.object.type == Question.TYPE_BOOLEAN:
                 for a in qs:
@@ -745,7 +812,7 @@ class QuestionView(EventPermissionRequiredMixin, QuestionMixin, ChartContainingV
 
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data()
-        ctx['items'] = self.object.items.all()
+        ctx['items'] = self.items
         stats = self.get_answer_statistics()
         ctx['stats'], ctx['total'] = stats
         return ctx
@@ -765,20 +832,10 @@ class QuestionView(EventPermissionRequiredMixin, QuestionMixin, ChartContainingV
         })
 
 
-class QuestionUpdate(EventPermissionRequiredMixin, QuestionMixin, UpdateView):
-    model = Question
+class QuestionUpdate(EventPermissionRequiredMixin, QuestionDetailMixin, QuestionMixin, UpdateView):
     form_class = QuestionForm
     template_name = 'pretixcontrol/items/question_edit.html'
     permission = 'can_change_items'
-    context_object_name = 'question'
-
-    def get_object(self, queryset=None) -> Question:
-        try:
-            return self.request.event.questions.get(
-                id=self.kwargs['question']
-            )
-        except Question.DoesNotExist:
-            raise Http404(_("The requested question does not exist."))
 
     @transaction.atomic
     def form_valid(self, form):
@@ -786,10 +843,12 @@ class QuestionUpdate(EventPermissionRequiredMixin, QuestionMixin, UpdateView):
             if not self.save_formset(self.get_object()):
                 return self.get(self.request, *self.args, **self.kwargs)
 
-        if form.has_changed():
+        changed = form.changed_data
+        if changed:
+            cleaned_data = form.cleaned_data
             self.object.log_action(
                 'pretix.event.question.reordered', user=self.request.user, data={
-                    k: form.cleaned_data.get(k) for k in form.changed_data
+                    k: cleaned_data.get(k) for k in changed
                 }
             )
         messages.success(self.request, _('Your changes have been saved.'))
@@ -854,15 +913,15 @@ class QuotaList(PaginationMixin, ListView):
 
     def get_queryset(self):
         qs = self.request.event.quotas.prefetch_related(
-            Prefetch(
-                "items",
-                queryset=Item.objects.annotate(
+            # QuotaAvailability re-uses the prefetched items and variations
+            *QuotaAvailability.prefetch_products(
+                items_queryset=Item.objects.only('id', 'event_id', 'name', 'internal_name').annotate(
                     has_variations=Exists(ItemVariation.objects.filter(item=OuterRef('pk')))
                 ),
-                to_attr="cached_items"
+                variations_queryset=ItemVariation.objects.select_related("item").only(
+                    'id', 'item_id', 'value', 'item__id', 'item__event_id', 'item__name', 'item__internal_name',
+                ),
             ),
-            "variations",
-            "variations__item",
             Prefetch(
                 "subevent",
                 queryset=self.request.event.subevents.all()
@@ -937,8 +996,8 @@ class QuotaCreate(EventPermissionRequiredMixin, CreateView):
             i = modelcopy(self.copy_from)
             i.pk = None
             kwargs['instance'] = i
-            kwargs['initial']['itemvars'] = [str(i.pk) for i in self.copy_from.items.all()] + [
-                '{}-{}'.format(v.item_id, v.pk) for v in self.copy_from.variations.all()
+            kwargs['initial']['itemvars'] = [str(pk) for pk in self.copy_from.items.values_list('pk', flat=True)] + [
+                '{}-{}'.format(item_id, pk) for item_id, pk in self.copy_from.variations.values_list('item_id', 'pk')
             ]
         else:
             kwargs['instance'] = Quota(event=self.request.event)
@@ -952,14 +1011,30 @@ class QuotaCreate(EventPermissionRequiredMixin, CreateView):
         return super().form_invalid(form)
 
 
-class QuotaView(ChartContainingView, DetailView):
+class QuotaDetailMixin(SingleObjectMixin):
     model = Quota
-    template_name = 'pretixcontrol/items/quota.html'
     context_object_name = 'quota'
 
+    def get_object(self, queryset=None) -> Quota:
+        try:
+            if not getattr(self, 'object', None):
+                self.object = self.request.event.quotas.select_related('subevent').get(
+                    id=self.kwargs['quota']
+                )
+            return self.object
+        except Quota.DoesNotExist:
+            raise Http404(_("The requested quota does not exist."))
+
+
+class QuotaView(QuotaDetailMixin, ChartContainingView, DetailView):
+    template_name = 'pretixcontrol/items/quota.html'
+
     def get_context_data(self, *args, **kwargs):
         ctx = super().get_context_data()
 
+        # Used by QuotaAvailability as well as for the voucher check below, which only need the ids
+        prefetch_related_objects([self.object], *QuotaAvailability.prefetch_products())
+
         qa = QuotaAvailability(full_results=True)
         qa.queue(self.object)
         qa.compute()
@@ -997,7 +1072,7 @@ class QuotaView(ChartContainingView, DetailView):
             },
         ]
 
-        sum_values = sum([d['value'] for d in data if d['sum']])
+        sum_values = sum(d['value'] for d in data if d['sum'])
         s = self.object.size - sum_values if self.object.size is not None else gettext('Infinite')
 
         data.append({
@@ -1020,11 +1095,14 @@ class QuotaView(ChartContainingView, DetailView):
                 'strong': True
             })
 
+        chart_data = []
         for d in data:
-            if isinstance(d.get('value', 0), int) and d.get('value', 0) < 0:
+            if isinstance(d['value'], int) and d['value'] < 0:
                 d['value_abs'] = abs(d['value'])
-        ctx['quota_chart_data'] = json.dumps([r for r in data if r.get('sum') and r['value'] >= 0])
-        ctx['quota_table_rows'] = list(data)
+            elif d['sum']:
+                chart_data.append(d)
+        ctx['quota_chart_data'] = json.dumps(chart_data)
+        ctx['quota_table_rows'] = data
         ctx['quota_overbooked'] = sum_values - self.object.size if self.object.size is not None else 0
 
         ctx['has_plugins'] = False
@@ -1033,10 +1111,11 @@ class QuotaView(ChartContainingView, DetailView):
             Quota.AVAILABILITY_OK,
             self.object.size - sum_values if self.object.size is not None else None
         )
-        for recv, resp in quota_availability.send(sender=self.request.event, quota=self.object, result=res,
-                                                  count_waitinglist=True):
+        for recv, resp in quota_availability.send_lazy(sender=self.request.event, quota=self.object, result=res,
+                                                       count_waitinglist=True):
             if resp != res:
                 ctx['has_plugins'] = True
+                break
 
         ctx['has_ignore_vouchers'] = Voucher.objects.filter(
             Q(allow_ignore_quota=True) &
@@ -1045,31 +1124,24 @@ class QuotaView(ChartContainingView, DetailView):
                 (
                     (  # Orders for items which do not have any variations
                         Q(variation__isnull=True) &
-                        Q(item_id__in=Quota.items.through.objects.filter(quota_id=self.object.pk).values_list('item_id', flat=True))
+                        Q(item_id__in=[i.pk for i in self.object.availability_items])
                     ) | (  # Orders for items which do have any variations
-                        Q(variation__in=Quota.variations.through.objects.filter(quota_id=self.object.pk).values_list(
-                            'itemvariation_id', flat=True))
+                        Q(variation_id__in=[v.pk for v in self.object.availability_variations])
                     )
                 ) | Q(quota=self.object)
             ) &
             Q(redeemed__lt=F('max_usages'))
         ).exists()
-        if self.object.closed:
+        if self.object.closed and ctx['has_plugins']:
             qa = QuotaAvailability(ignore_closed=True)
             qa.queue(self.object)
             qa.compute()
             ctx['closed_and_sold_out'] = qa.results[self.object][0] <= Quota.AVAILABILITY_ORDERED
+        elif self.object.closed:
+            ctx['closed_and_sold_out'] = qa.results_ignoring_closed[self.object][0] <= Quota.AVAILABILITY_ORDERED
 
         return ctx
 
-    def get_object(self, queryset=None) -> Quota:
-        try:
-            return self.request.event.quotas.get(
-                id=self.kwargs['quota']
-            )
-        except Quota.DoesNotExist:
-            raise Http404(_("The requested quota does not exist."))
-
     def post(self, request, *args, **kwargs):
         if not request.user.has_event_permission(request.organizer, request.event, 'can_change_items', request):
             raise PermissionDenied()
@@ -1097,32 +1169,24 @@ class QuotaView(ChartContainingView, DetailView):
         }))
 
 
-class QuotaUpdate(EventPermissionRequiredMixin, UpdateView):
-    model = Quota
+class QuotaUpdate(EventPermissionRequiredMixin, QuotaDetailMixin, UpdateView):
     form_class = QuotaForm
     template_name = 'pretixcontrol/items/quota_edit.html'
     permission = 'can_change_items'
-    context_object_name = 'quota'
 
     def get_context_data(self, *args, **kwargs):
         ctx = super().get_context_data()
         return ctx
 
-    def get_object(self, queryset=None) -> Quota:
-        try:
-            return self.request.event.quotas.get(
-                id=self.kwargs['quota']
-            )
-        except Quota.DoesNotExist:
-            raise Http404(_("The requested quota does not exist."))
-
     @transaction.atomic
     def form_valid(self, form):
         messages.success(self.request, _('Your changes have been saved.'))
-        if form.has_changed():
+        changed = form.changed_data
+        if changed:
+            cleaned_data = form.cleaned_data
             self.object.log_action(
                 'pretix.event.quota.changed', user=self.request.user, data={
-                    k: form.cleaned_data.get(k) for k in form.changed_data
+                    k: cleaned_data.get(k) for k in changed
                 }
             )
             if ((form.initial.get('subevent') and not form.instance.subevent) or
@@ -1156,23 +1220,13 @@ class QuotaUpdate(EventPermissionRequiredMixin, UpdateView):
         return super().form_invalid(form)
 
 
-class QuotaDelete(EventPermissionRequiredMixin, CompatDeleteView):
-    model = Quota
+class QuotaDelete(EventPermissionRequiredMixin, QuotaDetailMixin, CompatDeleteView):
     template_name = 'pretixcontrol/items/quota_delete.html'
     permission = 'can_change_items'
-    context_object_name = 'quota'
-
-    def get_object(self, queryset=None) -> Quota:
-        try:
-            return self.request.event.quotas.get(
-                id=self.kwargs['quota']
-            )
-        except Quota.DoesNotExist:
-            raise Http404(_("The requested quota does not exist."))
 
     def get_context_data(self, *args, **kwargs) -> dict:
         context = super().get_context_data(*args, **kwargs)
-        context['dependent'] = list(self.object.items.all())
+        context['dependent'] = list(self.object.items.only('id', 'event_id', 'name', 'internal_name'))
         context['vouchers'] = self.object.vouchers.count()
         return context
 
@@ -1214,9 +1268,10 @@ class MetaDataEditorMixin:
 
     @cached_property
     def meta_forms(self):
-        if getattr(self, 'object', None):
+        item = getattr(self, 'object', None)
+        if item:
             val_instances = {
-                v.property_id: v for v in self.object.meta_values.all()
+                v.property_id: v for v in item.meta_values.all()
             }
         else:
             val_instances = {}
@@ -1228,35 +1283,42 @@ class MetaDataEditorMixin:
         else:
             defaults = {}
 
+        data = self.request.POST if self.request.method == "POST" else None
         formlist = []
 
         for p in self.request.event.item_meta_properties.all():
-            formlist.append(self._make_meta_form(p, val_instances, defaults))
+            instance = val_instances.get(p.pk)
+            if instance is None:
+                instance = self.meta_model(property=p, item=item, value=defaults.get(p.pk, None))
+            formlist.append(self.meta_form(
+                prefix='prop-{}'.format(p.pk),
+                property=p,
+                instance=instance,
+                data=data,
+            ))
         return formlist
 
-    def _make_meta_form(self, p, val_instances, defaults):
-        return self.meta_form(
-            prefix='prop-{}'.format(p.pk),
-            property=p,
-            instance=val_instances.get(
-                p.pk,
-                self.meta_model(
-                    property=p,
-                    item=self.object if getattr(self, 'object', None) else None,
-                    value=defaults.get(p.pk, None)
-                )
-            ),
-            data=(self.request.POST if self.request.method == "POST" else None)
-        )
-
     def save_meta(self):
+        to_create = []
+        to_update = []
+        to_delete = []
         for f in self.meta_forms:
             if f.cleaned_data.get('value'):
                 if not f.instance.item_id:
                     f.instance.item = self.object
-                f.save()
+                if not f.instance.pk:
+                    to_create.append(f.instance)
+                elif f.has_changed():
+                    to_update.append(f.instance)
             elif f.instance and f.instance.pk:
-                f.instance.delete()
+                to_delete.append(f.instance.pk)
+
+        if to_delete:
+            self.meta_model.objects.filter(pk__in=to_delete).delete()
+        if to_update:
+            self.meta_model.objects.bulk_update(to_update, ['value'])
+        if to_create:
+            self.meta_model.objects.bulk_create(to_create)
 
 
 class ItemCreate(EventPermissionRequiredMixin, MetaDataEditorMixin, CreateView):
@@ -1300,12 +1362,7 @@ class ItemCreate(EventPermissionRequiredMixin, MetaDataEditorMixin, CreateView):
 
         ret = super().form_valid(form)
         self.save_meta()
-        form.instance.log_action('pretix.event.item.added', user=self.request.user, data={
-            k: (form.cleaned_data.get(k).name
-                if isinstance(form.cleaned_data.get(k), File)
-                else form.cleaned_data.get(k))
-            for k in form.changed_data
-        })
+        form.instance.log_action('pretix.event.item.added', user=self.request.user, data=changed_data_for_log(form))
         return ret
 
     def get_form_kwargs(self):
@@ -1371,20 +1428,14 @@ class ItemUpdateGeneral(ItemDetailMixin, EventPermissionRequiredMixin, MetaDataE
             and all(f.is_valid() for f in self.formsets.values())
         )
         if v and form.cleaned_data['category'] and form.cleaned_data['category'].is_addon:
-            addons = self.formsets['addons'].ordered_forms + [
-                ef for ef in self.formsets['addons'].extra_forms
-                if ef not in self.formsets['addons'].ordered_forms and ef not in self.formsets['addons'].deleted_forms
-            ]
+            addons = self._active_forms(self.formsets['addons'])
             if addons:
                 messages.error(self.request,
                                _('You cannot add add-ons to a product that is only available as an add-on '
                                  'itself.'))
                 v = False
 
-            bundles = [
-                ef for ef in self.formsets['bundles'].forms
-                if ef not in self.formsets['bundles'].deleted_forms
-            ]
+            bundles = self._active_forms(self.formsets['bundles'], order=False)
             if bundles:
                 messages.error(self.request,
                                _('You cannot add bundles to a product that is only available as an add-on '
@@ -1400,8 +1451,18 @@ class ItemUpdateGeneral(ItemDetailMixin, EventPermissionRequiredMixin, MetaDataE
         else:
             return self.form_invalid(form)
 
+    @staticmethod
+    def _active_forms(formset, order=True):
+        deleted = set(formset.deleted_forms)
+        if order:
+            ordered_forms = formset.ordered_forms
+            skip = deleted.union(ordered_forms)
+            return ordered_forms + [ef for ef in formset.extra_forms if ef not in skip]
+        return [ef for ef in formset.forms if ef not in deleted]
+
     def save_formset(self, key, log_base, attr='item', order=True, serializer=None,
                      rm_verb='removed'):
+        item = self.get_object()
         for form in self.formsets[key].deleted_forms:
             if not form.instance.pk:
                 continue
@@ -1410,39 +1471,45 @@ class ItemUpdateGeneral(ItemDetailMixin, EventPermissionRequiredMixin, MetaDataE
             }
             if serializer:
                 d.update(serializer(form.instance, context={'event': self.request.event}).data)
-            self.get_object().log_action(
+            item.log_action(
                 'pretix.event.item.{}.{}'.format(log_base, rm_verb), user=self.request.user, data=d
             )
             form.instance.delete()
             form.instance.pk = None
 
-        if order:
-            forms = self.formsets[key].ordered_forms + [
-                ef for ef in self.formsets[key].extra_forms
-                if ef not in self.formsets[key].ordered_forms and ef not in self.formsets[key].deleted_forms
-            ]
-        else:
-            forms = [
-                ef for ef in self.formsets[key].forms
-                if ef not in self.formsets[key].deleted_forms
-            ]
+        forms = self._active_forms(self.formsets[key], order=order)
+        reordered = []
         for i, form in enumerate(forms):
+            created = not form.instance.pk
+            changed = [a for a in form.changed_data if a != 'ORDER']
+            if not created and not changed:
+                # Nothing but the position can have changed, which we write for all such forms at once below
+                if order and form.instance.position != i:
+                    form.instance.position = i
+                    reordered.append(form.instance)
+                continue
+
             if order:
                 form.instance.position = i
-            setattr(form.instance, attr, self.get_object())
-            created = not form.instance.pk
+            if created:
+                # Instances loaded through the formset querysets already reference the item
+                setattr(form.instance, attr, item)
             form.save()
-            if form.has_changed() and any(a for a in form.changed_data if a != 'ORDER'):
+            if changed:
                 change_data = {k: form.cleaned_data.get(k) for k in form.changed_data}
                 if key == 'variations':
                     change_data['value'] = form.instance.value
                 change_data['id'] = form.instance.pk
-                self.get_object().log_action(
+                item.log_action(
                     'pretix.event.item.{}.changed'.format(log_base) if not created else
                     'pretix.event.item.{}.added'.format(log_base),
                     user=self.request.user, data=change_data
                 )
 
+        if reordered:
+            type(reordered[0]).objects.bulk_update(reordered, ['position'])
+            self.request.event.cache.clear()
+
     @transaction.atomic
     def form_valid(self, form):
         self.save_meta()
@@ -1453,21 +1520,11 @@ class ItemUpdateGeneral(ItemDetailMixin, EventPermissionRequiredMixin, MetaDataE
             for k in form.changed_data
         }
         for f in self.plugin_forms:
-            change_data.update({
-                k: (f.cleaned_data.get(k).name
-                    if isinstance(f.cleaned_data.get(k), File)
-                    else f.cleaned_data.get(k))
-                for k in f.changed_data
-            })
+            change_data.update(changed_data_for_log(f))
 
         meta_changed = {}
         for f in self.meta_forms:
-            meta_changed.update({
-                k: (f.cleaned_data.get(k).name
-                    if isinstance(f.cleaned_data.get(k), File)
-                    else f.cleaned_data.get(k))
-                for k in f.changed_data
-            })
+            meta_changed.update(changed_data_for_log(f))
         if meta_changed:
             change_data['meta_data'] = meta_changed
 
@@ -1528,50 +1585,39 @@ class ItemUpdateGeneral(ItemDetailMixin, EventPermissionRequiredMixin, MetaDataE
 
     @cached_property
     def formsets(self):
-        f = OrderedDict([
-            ('variations', inlineformset_factory(
-                Item, ItemVariation,
-                form=ItemVariationForm, formset=ItemVariationsFormSet,
-                can_order=True, can_delete=True, extra=0
-            )(
+        item = self.get_object()
+        f = OrderedDict()
+        if item.has_variations:
+            # Constructing the variations formset already loads the event's sales channels, so skip it if it's not shown
+            f['variations'] = ItemVariationInlineFormSet(
                 self.request.POST if self.request.method == "POST" else None,
-                queryset=ItemVariation.objects.filter(item=self.get_object()).prefetch_related(
-                    'meta_values', 'limit_sales_channels', 'require_membership_types'
+                queryset=item.variations.prefetch_related(
+                    # The variation forms only need to know which sales channels and membership types are selected
+                    Prefetch('meta_values', queryset=ItemVariationMetaValue.objects.only(
+                        'id', 'variation_id', 'property_id', 'value'
+                    )),
+                    Prefetch('limit_sales_channels', queryset=SalesChannel.objects.only('id', 'identifier')),
+                    Prefetch('require_membership_types', queryset=MembershipType.objects.only('id')),
                 ),
                 event=self.request.event, prefix="variations"
-            )),
-            ('addons', inlineformset_factory(
-                Item, ItemAddOn,
-                form=ItemAddOnForm, formset=ItemAddOnsFormSet,
-                can_order=True, can_delete=True, extra=0
-            )(
-                self.request.POST if self.request.method == "POST" else None,
-                queryset=ItemAddOn.objects.filter(base_item=self.get_object()),
-                event=self.request.event, prefix="addons"
-            )),
-            ('bundles', inlineformset_factory(
-                Item, ItemBundle,
-                form=ItemBundleForm, formset=ItemBundleFormSet,
-                fk_name='base_item',
-                can_order=False, can_delete=True, extra=0
-            )(
-                self.request.POST if self.request.method == "POST" else None,
-                queryset=ItemBundle.objects.filter(base_item=self.get_object()),
-                event=self.request.event, item=self.item, prefix="bundles"
-            )),
-        ])
-        if not self.object.has_variations:
-            del f['variations']
+            )
+        f['addons'] = ItemAddOnInlineFormSet(
+            self.request.POST if self.request.method == "POST" else None,
+            queryset=item.addons.all(),
+            event=self.request.event, prefix="addons"
+        )
+        f['bundles'] = ItemBundleInlineFormSet(
+            self.request.POST if self.request.method == "POST" else None,
+            queryset=item.bundles.all(),
+            event=self.request.event, item=item, prefix="bundles"
+        )
 
-        i = 0
-        for rec, resp in item_formsets.send(sender=self.request.event, item=self.item, request=self.request):
-            if isinstance(resp, (list, tuple)):
-                for k in resp:
-                    f['p-{}'.format(i)] = k
-                    i += 1
-            else:
-                f['p-{}'.format(i)] = resp
-                i += 1
+        plugin_formsets = chain.from_iterable(
+            resp if isinstance(resp, (list, tuple)) else (resp,)
+            for rec, resp in item_formsets.send(sender=self.request.event, item=item, request=self.request)
+        )
+        for i, k in enumerate(plugin_formsets):
+            f['p-{}'.format(i)] = k
         return f
 
 
@@ -1588,48 +1634,82 @@ class ItemDelete(EventPermissionRequiredMixin, CompatDeleteView):
         return context
 
     def is_allowed(self) -> bool:
-        return not self.get_object().orderposition_set.exists()
+        if not hasattr(self, '_has_positions'):
+            o = self.get_object()
+            # get_object() annotates this, but don't rely on it if the object has been set differently
+            if hasattr(o, 'has_positions'):
+                self._has_positions = o.has_positions
+            else:
+                self._has_positions = OrderPosition.all.filter(item=o).exists()
+        return not self._has_positions
 
     def get_object(self, queryset=None) -> Item:
         if not hasattr(self, 'object') or not self.object:
             try:
-                self.object = self.request.event.items.get(
+                # Deleting or deactivating the product does not need any of its settings
+                self.object = self.request.event.items.only(
+                    'id', 'event_id', 'name', 'internal_name', 'active', 'hide_without_voucher', 'require_voucher',
+                ).annotate(
+                    has_positions=Exists(OrderPosition.all.filter(item=OuterRef('pk'))),
+                ).get(
                     id=self.kwargs['item']
                 )
             except Item.DoesNotExist:
                 raise Http404(_("The requested product does not exist."))
         return self.object
 
-    @transaction.atomic
+    def _lock(self, o) -> bool:
+        # If another request is deleting the same product right now, don't queue up behind its lock
+        return bool(self.request.event.items.select_for_update(
+            skip_locked=connections['default'].features.has_select_for_update_skip_locked, of=OF_SELF
+        ).filter(pk=o.pk).values_list('pk', flat=True))
+
     def delete(self, request, *args, **kwargs):
         success_url = self.get_success_url()
         o = self.get_object()
-        if o.allow_delete():
-            try:
-                CartPosition.objects.filter(addon_to__item=self.get_object()).delete()
-                self.get_object().cartposition_set.all().delete()
-                self.get_object().log_action('pretix.event.item.deleted', user=self.request.user)
-                self.get_object().delete()
-            except ProtectedError:
-                o = self.get_object()
+        # Same as Item.allow_delete(), but the positions have already been checked in get_object()
+        if self.is_allowed() and not Transaction.objects.filter(item=o).exists():
+            # Check before emptying any carts, so that we don't touch them if another request is busy with the product
+            with transaction.atomic():
+                if not self._lock(o):
+                    messages.error(request, _('The selected product is already being deleted or changed right now.'))
+                    return HttpResponseRedirect(success_url)
+            # A popular product can be in a lot of carts. We remove them in batches before we start the transaction
+            # that deletes the product, so we never hold locks on all of them at once. Add-ons need to go first, since
+            # they protect their base positions from being deleted.
+            slow_delete(CartPosition.objects.filter(addon_to__item=o), sleep_time=0)
+            slow_delete(CartPosition.objects.filter(item=o), sleep_time=0)
+            with transaction.atomic():
+                if not self._lock(o):
+                    # Another request got hold of the product while we emptied the carts. The removed cart
+                    # positions are not restored, they would have been removed by the deletion anyway.
+                    messages.error(request, _('The selected product is already being deleted or changed right now.'))
+                    return HttpResponseRedirect(success_url)
+                try:
+                    # Item.delete() detaches the vouchers before the collector finds out whether anything protects
+                    # the product, so roll that back together with the log entry if it does.
+                    with transaction.atomic():
+                        o.log_action('pretix.event.item.deleted', user=self.request.user)
+                        o.delete()
+                except ProtectedError:
+                    o.active = False
+                    o.save(update_fields=['active'])
+                    o.log_action('pretix.event.item.changed', user=self.request.user, data={
+                        'active': False
+                    })
+                    messages.error(self.request, _('The product could not be deleted as some constraints (e.g. data created by '
+                                                   'plug-ins) did not allow it. Deleting it could break reporting or other '
+                                                   'functionality, so the product has been disabled instead.'))
+                else:
+                    messages.success(request, _('The selected product has been deleted.'))
+            return HttpResponseRedirect(success_url)
+        else:
+            with transaction.atomic():
                 o.active = False
-                o.save()
+                o.save(update_fields=['active'])
                 o.log_action('pretix.event.item.changed', user=self.request.user, data={
                     'active': False
                 })
-                messages.error(self.request, _('The product could not be deleted as some constraints (e.g. data created by '
-                                               'plug-ins) did not allow it. Deleting it could break reporting or other '
-                                               'functionality, so the product has been disabled instead.'))
-            else:
-                messages.success(request, _('The selected product has been deleted.'))
-            return HttpResponseRedirect(success_url)
-        else:
-            o = self.get_object()
-            o.active = False
-            o.save()
-            o.log_action('pretix.event.item.changed', user=self.request.user, data={
-                'active': False
-            })
             messages.success(request, _('The selected product has been deactivated.'))
             return HttpResponseRedirect(success_url)
 
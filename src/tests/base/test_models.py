@@ -45,7 +45,10 @@ from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.files.storage import default_storage
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.db.models import Prefetch
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils.timezone import now
 from django_scopes import scope, scopes_disabled
 from freezegun import freeze_time
@@ -138,6 +141,46 @@ class QuotaTestCase(BaseQuotaTestCase):
         OrderPosition.objects.create(order=order, item=self.item2, variation=self.var1, price=2)
         self.assertEqual(self.var1.check_quotas(), (Quota.AVAILABILITY_GONE, 0))
 
+    @classscope(attr='o')
+    def test_sold_out_prefetched(self):
+        self.quota.items.add(self.item2)
+        self.quota.variations.add(self.var1)
+        order = Order.objects.create(event=self.event, status=Order.STATUS_PAID,
+                                     expires=now() + timedelta(days=3),
+                                     sales_channel=self.event.organizer.sales_channels.get(identifier="web"),
+                                     total=4)
+        OrderPosition.objects.create(order=order, item=self.item2, variation=self.var1, price=2)
+        OrderPosition.objects.create(order=order, item=self.item2, variation=self.var2, price=2)
+
+        quota = Quota.objects.prefetch_related(*QuotaAvailability.prefetch_products()).get(pk=self.quota.pk)
+        qa = QuotaAvailability(full_results=True)
+        qa.queue(quota)
+        with CaptureQueriesContext(connection) as ctx:
+            qa.compute()
+        assert not any('pretixbase_quota_items' in q['sql'] or 'pretixbase_quota_variations' in q['sql']
+                       for q in ctx.captured_queries)
+        assert qa.results[quota] == (Quota.AVAILABILITY_OK, 1)
+        assert qa.count_paid_orders[quota] == 1
+
+    @classscope(attr='o')
+    def test_sold_out_filtered_prefetch_ignored(self):
+        self.quota.items.add(self.item2)
+        self.quota.variations.add(self.var1)
+        order = Order.objects.create(event=self.event, status=Order.STATUS_PAID,
+                                     expires=now() + timedelta(days=3),
+                                     sales_channel=self.event.organizer.sales_channels.get(identifier="web"),
+                                     total=4)
+        OrderPosition.objects.create(order=order, item=self.item2, variation=self.var1, price=2)
+        OrderPosition.objects.create(order=order, item=self.item2, variation=self.var1, price=2)
+
+        quota = Quota.objects.prefetch_related(
+            'items', Prefetch('variations', queryset=ItemVariation.objects.none())
+        ).get(pk=self.quota.pk)
+        qa = QuotaAvailability(full_results=True)
+        qa.queue(quota)
+        qa.compute()
+        assert qa.results[quota] == (Quota.AVAILABILITY_GONE, 0)
+
     @classscope(attr='o')
     def test_ordered(self):
         self.quota.items.add(self.item1)
@@ -687,6 +730,29 @@ class QuotaTestCase(BaseQuotaTestCase):
         self.quota.save()
         assert self.quota.availability() == (Quota.AVAILABILITY_ORDERED, 0)
 
+    @classscope(attr='o')
+    def test_closed_full_results_ignoring_closed(self):
+        self.quota.items.add(self.item1)
+        self.quota.closed = True
+        self.quota.size = 2
+        self.quota.save()
+        CartPosition.objects.create(event=self.event, item=self.item1, price=2,
+                                    expires=now() + timedelta(days=3))
+        qa = QuotaAvailability(full_results=True)
+        qa.queue(self.quota)
+        qa.compute()
+        assert qa.results[self.quota] == (Quota.AVAILABILITY_ORDERED, 0)
+        assert qa.results_ignoring_closed[self.quota] == (Quota.AVAILABILITY_OK, 1)
+        assert qa.count_cart[self.quota] == 1
+
+        CartPosition.objects.create(event=self.event, item=self.item1, price=2,
+                                    expires=now() + timedelta(days=3))
+        qa = QuotaAvailability(full_results=True)
+        qa.queue(self.quota)
+        qa.compute()
+        assert qa.results[self.quota] == (Quota.AVAILABILITY_ORDERED, 0)
+        assert qa.results_ignoring_closed[self.quota] == (Quota.AVAILABILITY_RESERVED, 0)
+
 
 class CheckinQuotaTestCase(BaseQuotaTestCase):
 
@@ -23,6 +23,7 @@ import pytest
 from django.conf import settings
 from django.test import TestCase
 from django.utils.timezone import now
+from tests.testdummy.signals import lazy_signal, lazy_signal_calls
 
 from pretix.base.models import Event, Organizer
 from pretix.base.plugins import get_all_plugins
@@ -68,3 +69,29 @@ class PluginSignalTest(TestCase):
         responses = register_ticket_outputs.send(self.event, **payload)
         self.assertEqual(len(responses), 1)
         self.assertIn('tests.testdummy.signals', [r[0].__module__ for r in responses])
+
+    def test_send_lazy(self):
+        self.event.plugins = 'tests.testdummy'
+        self.event.save()
+        responses = register_ticket_outputs.send_lazy(self.event)
+        self.assertEqual(['tests.testdummy.signals'], [r[0].__module__ for r in responses])
+        self.event.plugins = ''
+        self.event.save()
+        self.assertEqual(list(register_ticket_outputs.send_lazy(self.event)), [])
+
+    def test_send_lazy_stops_calling_receivers(self):
+        self.event.plugins = 'tests.testdummy'
+        self.event.save()
+        lazy_signal_calls.clear()
+        self.assertEqual([resp for recv, resp in lazy_signal.send(self.event)], ['first', 'second'])
+        self.assertEqual(lazy_signal_calls, ['first', 'second'])
+
+        lazy_signal_calls.clear()
+        for recv, resp in lazy_signal.send_lazy(self.event):
+            self.assertEqual(resp, 'first')
+            break
+        self.assertEqual(lazy_signal_calls, ['first'])
+
+    def test_send_lazy_checks_sender(self):
+        with self.assertRaises(ValueError):
+            register_ticket_outputs.send_lazy(object())
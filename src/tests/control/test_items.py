@@ -40,8 +40,9 @@ from django_scopes import scopes_disabled
 from tests.base import SoupTest, extract_form_fields
 
 from pretix.base.models import (
-    Discount, Event, Item, ItemCategory, ItemVariation, Order, OrderPosition,
-    Organizer, Question, Quota, Team, User,
+    CartPosition, Discount, Event, Invoice, InvoiceLine, Item, ItemCategory,
+    ItemVariation, Order, OrderPosition, Organizer, Question, Quota,
+    SeatCategoryMapping, Team, User,
 )
 
 
@@ -206,6 +207,33 @@ class QuestionsTest(ItemFormTest):
             assert c.options.exists()
             assert str(c.options.first().answer) == 'Germany'
 
+    def test_add_multiple_choices(self):
+        with scopes_disabled():
+            c = Question.objects.create(event=self.event1, question="What country are you from?", type="C", required=True)
+            o1 = c.options.create(answer='Austria')
+        doc = self.get_doc('/control/event/%s/%s/questions/%s/change' % (self.orga1.slug, self.event1.slug, c.id))
+        form_data = extract_form_fields(doc.select('.container-fluid form')[0])
+        form_data['form-TOTAL_FORMS'] = '4'
+        form_data['form-INITIAL_FORMS'] = '1'
+        form_data['form-MIN_NUM_FORMS'] = '0'
+        form_data['form-MAX_NUM_FORMS'] = '4'
+        form_data['items'] = self.item1.id
+        form_data['form-0-id'] = o1.pk
+        form_data['form-0-answer_0'] = 'Austria'
+        for i, answer in enumerate(['Germany', 'France', 'Italy'], start=1):
+            form_data['form-%d-id' % i] = ''
+            form_data['form-%d-answer_0' % i] = answer
+        self.post_doc('/control/event/%s/%s/questions/%s/change' % (self.orga1.slug, self.event1.slug, c.id),
+                      form_data)
+        with scopes_disabled():
+            c = Question.objects.get(id=c.id)
+            options = list(c.options.all())
+            assert [str(o.answer) for o in options] == ['Austria', 'Germany', 'France', 'Italy']
+            assert [o.position for o in options] == [0, 1, 2, 3]
+            assert all(o.pk for o in options)
+            assert len({o.identifier for o in options}) == 4
+            assert c.all_logentries().filter(action_type='pretix.event.question.option.added').count() == 3
+
     def test_update(self):
         with scopes_disabled():
             c = Question.objects.create(event=self.event1, question="What is your shoe size?", type="N", required=True)
@@ -234,6 +262,61 @@ class QuestionsTest(ItemFormTest):
         with scopes_disabled():
             assert not Question.objects.filter(id=c.id).exists()
 
+    def test_list_system_questions(self):
+        self.event1.settings.attendee_emails_asked = True
+        self.event1.settings.attendee_addresses_asked = True
+        self.event1.settings.system_question_order = {'attendee_email': 2, 'city': 1}
+        with scopes_disabled():
+            Question.objects.create(event=self.event1, question="What is your shoe size?", type="N", position=0)
+        doc = self.get_doc('/control/event/%s/%s/questions/' % (self.orga1.slug, self.event1.slug))
+        text = doc.select("#page-wrapper")[0].text
+        assert "Attendee email" in text
+        assert "ZIP code" in text
+        assert "Company" not in text
+        assert text.index("shoe size") < text.index("City") < text.index("Attendee email")
+
+    def test_reorder(self):
+        with scopes_disabled():
+            q1 = Question.objects.create(event=self.event1, question="What is your shoe size?", type="N", position=0)
+            q2 = Question.objects.create(event=self.event1, question="What is your name?", type="S", position=1)
+        self.client.post('/control/event/%s/%s/questions/reorder' % (self.orga1.slug, self.event1.slug), {
+            'ids': [str(q2.id), 'attendee_email', str(q1.id)],
+        }, content_type='application/json')
+        q1.refresh_from_db()
+        q2.refresh_from_db()
+        assert q2.position == 0
+        assert q1.position == 2
+        self.event1.settings.flush()
+        assert self.event1.settings.system_question_order['attendee_email'] == 1
+        assert self.event1.settings.system_question_order['company'] == -1
+
+    def test_reorder_unchanged(self):
+        with scopes_disabled():
+            q1 = Question.objects.create(event=self.event1, question="What is your shoe size?", type="N", position=0)
+            self.event1.settings.system_question_order = {
+                'attendee_name_parts': -1, 'attendee_email': 1, 'company': -1, 'street': -1, 'zipcode': -1,
+                'city': -1, 'country': -1,
+            }
+        resp = self.client.post('/control/event/%s/%s/questions/reorder' % (self.orga1.slug, self.event1.slug), {
+            'ids': [str(q1.id), 'attendee_email'],
+        }, content_type='application/json')
+        assert resp.status_code == 200
+        with scopes_disabled():
+            assert not self.event1.logentry_set.exists()
+
+    def test_reorder_invalid(self):
+        with scopes_disabled():
+            q1 = Question.objects.create(event=self.event1, question="What is your shoe size?", type="N", position=0)
+            Question.objects.create(event=self.event1, question="What is your name?", type="S", position=1)
+        resp = self.client.post('/control/event/%s/%s/questions/reorder' % (self.orga1.slug, self.event1.slug), {
+            'ids': [str(q1.id), str(q1.id)],
+        }, content_type='application/json')
+        assert resp.status_code == 404
+        resp = self.client.post('/control/event/%s/%s/questions/reorder' % (self.orga1.slug, self.event1.slug), {
+            'ids': [str(q1.id)],
+        }, content_type='application/json')
+        assert resp.status_code == 404
+
     def test_question_view(self):
         with scopes_disabled():
             c = Question.objects.create(event=self.event1, question="What is your shoe size?", type="N", required=True)
@@ -253,13 +336,18 @@ class QuestionsTest(ItemFormTest):
             op = OrderPosition.objects.create(order=o, item=item1, variation=None, price=Decimal("14"),
                                               attendee_name_parts={'full_name': "Petra"})
             op.answers.create(question=c, answer='39')
+            OrderPosition.objects.create(order=o, item=item1, variation=None, price=Decimal("14"),
+                                         attendee_name_parts={'full_name': "Paul"})
+            c.items.add(item1)
 
         doc = self.get_doc('/control/event/%s/%s/questions/%s/' % (self.orga1.slug, self.event1.slug, c.id))
         tbl = doc.select('.container-fluid table.table-bordered tbody')[0]
         assert tbl.select('tr')[0].select('td')[0].text.strip() == '42'
         assert tbl.select('tr')[0].select('td')[1].text.strip() == '2'
+        assert tbl.select('tr')[0].select('td')[3].text.strip() == '50.0 %'
         assert tbl.select('tr')[1].select('td')[0].text.strip() == '39'
         assert tbl.select('tr')[1].select('td')[1].text.strip() == '1'
+        assert tbl.select('tr')[1].select('td')[3].text.strip() == '25.0 %'
 
         doc = self.get_doc('/control/event/%s/%s/questions/%s/?status=p' % (self.orga1.slug, self.event1.slug, c.id))
         assert not doc.select('.container-fluid table.table-bordered tbody')
@@ -270,6 +358,43 @@ class QuestionsTest(ItemFormTest):
         tbl = doc.select('.container-fluid table.table-bordered tbody')[0]
         assert tbl.select('tr')[0].select('td')[0].text.strip() == '42'
 
+    def test_question_view_file(self):
+        with scopes_disabled():
+            c = Question.objects.create(event=self.event1, question="Your photo", type="F", required=False)
+            c.items.add(self.item1)
+            o = Order.objects.create(code='FOO', event=self.event1, email='dummy@dummy.test',
+                                     status=Order.STATUS_PENDING, datetime=now(),
+                                     expires=now() + datetime.timedelta(days=10),
+                                     sales_channel=self.event1.organizer.sales_channels.get(identifier="web"),
+                                     total=14, locale='en')
+            op = OrderPosition.objects.create(order=o, item=self.item1, variation=None, price=Decimal("14"))
+            op.answers.create(question=c, answer='file://photo.jpg', file='photo.jpg')
+            OrderPosition.objects.create(order=o, item=self.item1, variation=None, price=Decimal("14"))
+
+        doc = self.get_doc('/control/event/%s/%s/questions/%s/' % (self.orga1.slug, self.event1.slug, c.id))
+        tbl = doc.select('.container-fluid table.table-bordered tbody')[0]
+        assert tbl.select('tr')[0].select('td')[0].text.strip() == 'File uploaded'
+        assert tbl.select('tr')[0].select('td')[1].text.strip() == '1'
+        assert tbl.select('tr')[0].select('td')[3].text.strip() == '50.0 %'
+
+    def test_question_view_date(self):
+        with scopes_disabled():
+            c = Question.objects.create(event=self.event1, question="Your birthday", type="D", required=False)
+            c.items.add(self.item1)
+            o = Order.objects.create(code='FOO', event=self.event1, email='dummy@dummy.test',
+                                     status=Order.STATUS_PENDING, datetime=now(),
+                                     expires=now() + datetime.timedelta(days=10),
+                                     sales_channel=self.event1.organizer.sales_channels.get(identifier="web"),
+                                     total=14, locale='en')
+            op = OrderPosition.objects.create(order=o, item=self.item1, variation=None, price=Decimal("14"))
+            op.answers.create(question=c, answer='1990-03-04')
+
+        doc = self.get_doc('/control/event/%s/%s/questions/%s/' % (self.orga1.slug, self.event1.slug, c.id))
+        tbl = doc.select('.container-fluid table.table-bordered tbody')[0]
+        assert tbl.select('tr')[0].select('td')[0].text.strip() == '1990-03-04'
+        assert tbl.select('tr')[0].select('td')[1].text.strip() == '1'
+        assert 'answer=1990-03-04' in tbl.select('tr')[0].select('a')[0]['href']
+
     def test_set_dependency(self):
         with scopes_disabled():
             q1 = Question.objects.create(event=self.event1, question="What country are you from?", type="C", required=True)
@@ -316,6 +441,31 @@ class QuestionsTest(ItemFormTest):
 
 class QuotaTest(ItemFormTest):
 
+    def test_view_ignore_vouchers(self):
+        with scopes_disabled():
+            q = Quota.objects.create(event=self.event1, name="Full house", size=500)
+            q.items.add(self.item1)
+            item2 = Item.objects.create(event=self.event1, name="Business", default_price=0)
+            var = ItemVariation.objects.create(item=item2, value="Gold")
+        doc = self.get_doc('/control/event/%s/%s/quotas/%s/' % (self.orga1.slug, self.event1.slug, q.id))
+        assert not doc.select('.alert-warning')
+
+        with scopes_disabled():
+            v = self.event1.vouchers.create(item=item2, variation=var, allow_ignore_quota=True)
+        doc = self.get_doc('/control/event/%s/%s/quotas/%s/' % (self.orga1.slug, self.event1.slug, q.id))
+        assert not doc.select('.alert-warning')
+
+        with scopes_disabled():
+            q.variations.add(var)
+        doc = self.get_doc('/control/event/%s/%s/quotas/%s/' % (self.orga1.slug, self.event1.slug, q.id))
+        assert doc.select('.alert-warning')
+
+        with scopes_disabled():
+            v.delete()
+            self.event1.vouchers.create(item=self.item1, allow_ignore_quota=True)
+        doc = self.get_doc('/control/event/%s/%s/quotas/%s/' % (self.orga1.slug, self.event1.slug, q.id))
+        assert doc.select('.alert-warning')
+
     def test_create(self):
         doc = self.get_doc('/control/event/%s/%s/quotas/add' % (self.orga1.slug, self.event1.slug))
         form_data = extract_form_fields(doc.select('.container-fluid form')[0])
@@ -326,6 +476,20 @@ class QuotaTest(ItemFormTest):
         assert doc.select(".alert-success")
         self.assertIn("Full house", doc.select("#page-wrapper table")[0].text)
 
+    def test_copy(self):
+        with scopes_disabled():
+            c = Quota.objects.create(event=self.event1, name="Full house", size=500)
+            item2 = Item.objects.create(event=self.event1, name="Business", default_price=0)
+            ItemVariation.objects.create(item=item2, value="Silver")
+            var = ItemVariation.objects.create(item=item2, value="Gold")
+            c.items.add(self.item1, item2)
+            c.variations.add(var)
+        doc = self.get_doc('/control/event/%s/%s/quotas/add?copy_from=%d' % (self.orga1.slug, self.event1.slug, c.pk))
+        assert doc.select('[name=name]')[0]['value'] == 'Full house'
+        assert sorted(i.get('value') for i in doc.select('[name=itemvars][checked]')) == sorted([
+            str(self.item1.pk), '{}-{}'.format(item2.pk, var.pk)
+        ])
+
     def test_update(self):
         with scopes_disabled():
             c = Quota.objects.create(event=self.event1, name="Full house", size=500)
@@ -365,7 +529,9 @@ class QuotaTest(ItemFormTest):
     def test_delete(self):
         with scopes_disabled():
             c = Quota.objects.create(event=self.event1, name="Full house", size=500)
+            c.items.add(self.item1)
         doc = self.get_doc('/control/event/%s/%s/quotas/%s/delete' % (self.orga1.slug, self.event1.slug, c.id))
+        assert str(self.item1) in doc.select('.alert-info')[0].text
         form_data = extract_form_fields(doc.select('.container-fluid form')[0])
         doc = self.post_doc('/control/event/%s/%s/quotas/%s/delete' % (self.orga1.slug, self.event1.slug, c.id),
                             form_data)
@@ -385,6 +551,29 @@ class QuotaTest(ItemFormTest):
             assert not c.closed
             assert c.close_when_sold_out
 
+    def test_view_closed_sold_out(self):
+        with scopes_disabled():
+            c = Quota.objects.create(event=self.event1, name="Full house", size=1,
+                                     close_when_sold_out=True, closed=True)
+            c.items.add(self.item1)
+            cp = CartPosition.objects.create(event=self.event1, item=self.item1, price=Decimal("14"), cart_id="123",
+                                             expires=now() + datetime.timedelta(days=1))
+        doc = self.get_doc('/control/event/%s/%s/quotas/%s/' % (self.orga1.slug, self.event1.slug, c.id))
+        assert doc.select('button[name=reopen]')
+        assert not doc.select('button[name=disable]')
+
+        with scopes_disabled():
+            cp.delete()
+            o = Order.objects.create(code='FOO', event=self.event1, email='dummy@dummy.test',
+                                     status=Order.STATUS_PAID, datetime=now(),
+                                     expires=now() + datetime.timedelta(days=10),
+                                     sales_channel=self.event1.organizer.sales_channels.get(identifier="web"),
+                                     total=14, locale='en')
+            OrderPosition.objects.create(order=o, item=self.item1, variation=None, price=Decimal("14"))
+        doc = self.get_doc('/control/event/%s/%s/quotas/%s/' % (self.orga1.slug, self.event1.slug, c.id))
+        assert doc.select('button[name=disable]')
+        assert not doc.select('button[name=reopen]')
+
     def test_reopen_and_disable(self):
         with scopes_disabled():
             c = Quota.objects.create(event=self.event1, name="Full house", size=500,
@@ -420,6 +609,17 @@ class ItemsTest(ItemFormTest):
         self.item2.refresh_from_db()
         assert self.item1.position < self.item2.position
 
+    def test_move_duplicate_positions(self):
+        with scopes_disabled():
+            item3 = Item.objects.create(event=self.event1, name="Student", default_price=0, position=2)
+        self.client.post('/control/event/%s/%s/items/%s/up' % (self.orga1.slug, self.event1.slug, self.item1.id),)
+        self.client.post('/control/event/%s/%s/items/%s/down' % (self.orga1.slug, self.event1.slug, self.item1.id),)
+        self.item1.refresh_from_db()
+        self.item2.refresh_from_db()
+        item3.refresh_from_db()
+        assert sorted([self.item1.position, self.item2.position, item3.position]) == [0, 1, 2]
+        assert self.item1.position == 1
+
     def test_reorder(self):
         self.client.post('/control/event/%s/%s/items/reorder/0/' % (self.orga1.slug, self.event1.slug), {
             'ids': [str(self.item2.id), str(self.item1.id)],
@@ -447,6 +647,26 @@ class ItemsTest(ItemFormTest):
         resp = self.client.get('/control/event/%s/%s/items/' % (self.orga1.slug, self.event1.slug))
         assert 'T-Shirt' in resp.content.decode()
 
+    def test_list_by_category(self):
+        with scopes_disabled():
+            self.item2.category = self.addoncat
+            self.item2.save()
+        doc = self.get_doc('/control/event/%s/%s/items/' % (self.orga1.slug, self.event1.slug))
+        rows = doc.select("table tbody tr")
+        assert "Standard" in rows[0].text
+        assert "Item category" in rows[1].text
+        assert "Business" in rows[2].text
+
+    def test_list_requires_seat(self):
+        doc = self.get_doc('/control/event/%s/%s/items/' % (self.orga1.slug, self.event1.slug))
+        assert not doc.select('[title="Product assigned to seating plan"]')
+        with scopes_disabled():
+            SeatCategoryMapping.objects.create(event=self.event1, product=self.item2, layout_category='Stalls')
+        doc = self.get_doc('/control/event/%s/%s/items/' % (self.orga1.slug, self.event1.slug))
+        rows = doc.select("table tbody tr")
+        assert not rows[0].select('[title="Product assigned to seating plan"]')
+        assert rows[1].select('[title="Product assigned to seating plan"]')
+
     def test_update(self):
         doc = self.get_doc('/control/event/%s/%s/items/%d/' % (self.orga1.slug, self.event1.slug, self.item2.id))
         d = extract_form_fields(doc.select('.container-fluid form')[0])
@@ -462,6 +682,24 @@ class ItemsTest(ItemFormTest):
         self.item1.refresh_from_db()
         assert self.item1.default_price == Decimal('23.00')
 
+    def test_update_meta(self):
+        with scopes_disabled():
+            foo = self.event1.item_meta_properties.create(name="Foo")
+            bar = self.event1.item_meta_properties.create(name="Bar")
+            baz = self.event1.item_meta_properties.create(name="Baz")
+            self.item1.meta_values.create(property=foo, value="Old")
+            self.item1.meta_values.create(property=bar, value="Remove me")
+        doc = self.get_doc('/control/event/%s/%s/items/%d/' % (self.orga1.slug, self.event1.slug, self.item1.id))
+        d = extract_form_fields(doc.select('.container-fluid form')[0])
+        d.update({
+            'prop-%d-value' % foo.pk: 'New',
+            'prop-%d-value' % bar.pk: '',
+            'prop-%d-value' % baz.pk: 'Added',
+        })
+        self.client.post('/control/event/%s/%s/items/%d/' % (self.orga1.slug, self.event1.slug, self.item1.id), d)
+        with scopes_disabled():
+            assert dict(self.item1.meta_values.values_list('property__name', 'value')) == {"Foo": "New", "Baz": "Added"}
+
     def test_update_validate_giftcard(self):
         doc = self.get_doc('/control/event/%s/%s/items/%d/' % (self.orga1.slug, self.event1.slug, self.item2.id))
         d = extract_form_fields(doc.select('.container-fluid form')[0])
@@ -616,6 +854,32 @@ class ItemsTest(ItemFormTest):
         self.var1.refresh_from_db()
         assert str(self.var1.value) == 'Bronze'
 
+    def test_reorder_variations(self):
+        doc = self.get_doc('/control/event/%s/%s/items/%d/' % (self.orga1.slug, self.event1.slug, self.item2.id))
+        d = extract_form_fields(doc.select('.container-fluid form')[0])
+        d.update({
+            'variations-TOTAL_FORMS': '2',
+            'variations-INITIAL_FORMS': '2',
+            'variations-MIN_NUM_FORMS': '0',
+            'variations-MAX_NUM_FORMS': '1000',
+            'variations-0-id': str(self.var1.pk),
+            'variations-0-value_0': 'Silver',
+            'variations-0-active': 'yes',
+            'variations-0-ORDER': '2',
+            'variations-1-id': str(self.var2.pk),
+            'variations-1-value_0': 'Gold',
+            'variations-1-active': 'yes',
+            'variations-1-ORDER': '1',
+        })
+        self.client.post('/control/event/%s/%s/items/%d/' % (self.orga1.slug, self.event1.slug, self.item2.id), d)
+        self.var1.refresh_from_db()
+        self.var2.refresh_from_db()
+        assert self.var2.position == 0
+        assert self.var1.position == 1
+        assert str(self.var1.value) == 'Silver'
+        with scopes_disabled():
+            assert not self.item2.all_logentries().filter(action_type='pretix.event.item.variation.changed').exists()
+
     def test_delete_variation(self):
         doc = self.get_doc('/control/event/%s/%s/items/%d/' % (self.orga1.slug, self.event1.slug, self.item2.id))
         d = extract_form_fields(doc.select('.container-fluid form')[0])
@@ -646,6 +910,49 @@ class ItemsTest(ItemFormTest):
         with scopes_disabled():
             assert not self.event1.items.filter(pk=self.item2.pk).exists()
 
+    def test_delete_in_cart(self):
+        with scopes_disabled():
+            cp = CartPosition.objects.create(event=self.event1, item=self.item1, price=Decimal("14"), cart_id="123",
+                                             expires=now() + datetime.timedelta(days=1))
+            CartPosition.objects.create(event=self.event1, item=self.item2, price=Decimal("14"), cart_id="123",
+                                        expires=now() + datetime.timedelta(days=1), addon_to=cp)
+            cp2 = CartPosition.objects.create(event=self.event1, item=self.item2, price=Decimal("14"), cart_id="123",
+                                              expires=now() + datetime.timedelta(days=1))
+            CartPosition.objects.create(event=self.event1, item=self.item1, price=Decimal("14"), cart_id="123",
+                                        expires=now() + datetime.timedelta(days=1), addon_to=cp2)
+        self.client.post('/control/event/%s/%s/items/%d/delete' % (self.orga1.slug, self.event1.slug, self.item1.id),
+                         {})
+        with scopes_disabled():
+            assert not self.event1.items.filter(pk=self.item1.pk).exists()
+            assert list(CartPosition.objects.all()) == [cp2]
+
+    def test_delete_confirmation(self):
+        with scopes_disabled():
+            self.event1.vouchers.create(item=self.item1)
+            self.event1.vouchers.create(item=self.item1)
+        doc = self.get_doc('/control/event/%s/%s/items/%d/delete' % (self.orga1.slug, self.event1.slug, self.item1.id))
+        assert "2 voucher" in doc.select(".alert-warning")[0].text
+        assert "Delete" in doc.select(".btn-save")[0].text
+
+        with scopes_disabled():
+            o = Order.objects.create(
+                code='FOO', event=self.event1, email='dummy@dummy.test',
+                status=Order.STATUS_CANCELED,
+                datetime=now(), expires=now() + datetime.timedelta(days=10),
+                sales_channel=self.event1.organizer.sales_channels.get(identifier="web"),
+                total=14, locale='en'
+            )
+            OrderPosition.objects.create(
+                order=o,
+                item=self.item1,
+                variation=None,
+                price=Decimal("14"),
+                canceled=True,
+            )
+        doc = self.get_doc('/control/event/%s/%s/items/%d/delete' % (self.orga1.slug, self.event1.slug, self.item1.id))
+        assert not doc.select(".alert-warning")
+        assert "Deactivate" in doc.select(".btn-save")[0].text
+
     def test_delete_ordered(self):
         with scopes_disabled():
             o = Order.objects.create(
@@ -669,6 +976,31 @@ class ItemsTest(ItemFormTest):
         self.item1.refresh_from_db()
         assert not self.item1.active
 
+    def test_delete_protected(self):
+        with scopes_disabled():
+            v = self.event1.vouchers.create(item=self.item1)
+            o = Order.objects.create(
+                code='FOO', event=self.event1, email='dummy@dummy.test',
+                status=Order.STATUS_CANCELED,
+                datetime=now(), expires=now() + datetime.timedelta(days=10),
+                sales_channel=self.event1.organizer.sales_channels.get(identifier="web"),
+                total=14, locale='en'
+            )
+            i = Invoice.objects.create(
+                order=o, event=self.event1, organizer=self.orga1, date=now().date(), locale='en', invoice_no='00001',
+            )
+            InvoiceLine.objects.create(invoice=i, item=self.item1, description='Standard', gross_value=Decimal('14.00'))
+        self.client.post('/control/event/%s/%s/items/%d/delete' % (self.orga1.slug, self.event1.slug, self.item1.id),
+                         {})
+        with scopes_disabled():
+            assert self.event1.items.filter(pk=self.item1.pk).exists()
+            self.item1.refresh_from_db()
+            assert not self.item1.active
+            v.refresh_from_db()
+            assert v.item == self.item1
+            assert not self.item1.all_logentries().filter(action_type='pretix.event.item.deleted').exists()
+            assert self.item1.all_logentries().filter(action_type='pretix.event.item.changed').exists()
+
     def test_create_copy(self):
         with scopes_disabled():
             q = Question.objects.create(event=self.event1, question="Size", type="N")
@@ -23,8 +23,8 @@ from django.dispatch import receiver
 
 from pretix.base.channels import SalesChannelType
 from pretix.base.signals import (
-    register_payment_providers, register_sales_channel_types,
-    register_ticket_outputs,
+    EventPluginSignal, register_payment_providers,
+    register_sales_channel_types, register_ticket_outputs,
 )
 from pretix.presale.signals import html_head
 
@@ -70,3 +70,20 @@ def html_head_presale(sender, request=None, **kwargs):
         # No tracking scripts on PCI DSS relevant payment pages
         return ""
     return "<script>alert('BAD TRACKING SCRIPT')</script>"
+
+
+# Used to test that EventPluginSignal.send_lazy() only calls receivers while it is iterated
+lazy_signal = EventPluginSignal()
+lazy_signal_calls = []
+
+
+@receiver(lazy_signal, dispatch_uid="dummy_lazy_first")
+def lazy_first(sender, **kwargs):
+    lazy_signal_calls.append('first')
+    return 'first'
+
+
+@receiver(lazy_signal, dispatch_uid="dummy_lazy_second")
+def lazy_second(sender, **kwargs):
+    lazy_signal_calls.append('second')
+    return 'second'